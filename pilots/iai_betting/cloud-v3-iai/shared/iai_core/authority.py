@@ -5,9 +5,19 @@ The Authority NEVER makes decisions unilaterally.
 It reviews evidence from the Evaluator and applies the invariant.
 """
 
-from typing import List, Dict, Any
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .hypotheses import BettingHypothesis
 from .evaluator import EvaluationResult
@@ -35,6 +45,63 @@ class AuthorityDecision:
     # Invariant check
     passes_invariant: bool
     invariant_threshold: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the fields (what asdict gives, without its recursive deep copy)."""
+        return {**self.__dict__, "reasoning": list(self.reasoning)}
+
+
+# Reasoning lines, formatted with the evaluation (ev), min_bets and threshold
+_REASONS = {
+    "insufficient": "Insufficient data: {ev.total_bets} bets < {min_bets} required",
+    "collect": "Decision: Continue collecting data",
+    "fails_invariant": "FAILS INVARIANT: Edge CI [{ev.edge_ci_lower:.2f}%, {ev.edge_ci_upper:.2f}%]",
+    "required": "Required: Lower bound > {threshold}% with 95% confidence",
+    "negative_edge": "Strategy has NEGATIVE edge ({ev.edge:.2f}%)",
+    "below_threshold": "Edge ({ev.edge:.2f}%) below threshold ({threshold}%)",
+    "wide_ci": "Confidence interval too wide - insufficient evidence",
+    "not_significant": "NOT statistically significant (p={ev.p_value:.4f})",
+    "random": "Cannot distinguish from random chance",
+    "unstable": "UNSTABLE across seasons (std={ev.edge_std:.2f}%)",
+    "unreliable": "Performance varies too much - unreliable",
+    "passes": "✓ PASSES INVARIANT: Edge = {ev.edge:.2f}% (CI: [{ev.edge_ci_lower:.2f}%, {ev.edge_ci_upper:.2f}%])",
+    "significant": "✓ Statistically significant (p={ev.p_value:.4f})",
+    "stable": "✓ Stable across seasons (std={ev.edge_std:.2f}%)",
+    "win_rate": "✓ Win rate: {ev.win_rate:.1f}% on {ev.total_bets} bets",
+    "approve": "Decision: APPROVE for deployment",
+}
+
+def _json_default(obj):
+    """Serialise NumPy scalars (e.g. bool_ flags from the Evaluator)."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Check bits: enough data, passes invariant, significant, stable
+_ENOUGH_DATA, _PASSES_INVARIANT, _SIGNIFICANT, _STABLE = 1, 2, 4, 8
+
+
+def _build_decision_table():
+    """Map every combination of check bits to (decision, reason ids).
+    
+    Checks apply in order - data, invariant, significance, stability - and
+    the first failure decides. An invariant failure adds one more line that
+    depends on the edge itself, chosen in review().
+    """
+    table = []
+    for mask in range(16):
+        if not mask & _ENOUGH_DATA:
+            table.append(("DEFER", ("insufficient", "collect")))
+        elif not mask & _PASSES_INVARIANT:
+            table.append(("REJECT", ("fails_invariant", "required")))
+        elif not mask & _SIGNIFICANT:
+            table.append(("REJECT", ("not_significant", "random")))
+        elif not mask & _STABLE:
+            table.append(("REJECT", ("unstable", "unreliable")))
+        else:
+            table.append(("ACCEPT", ("passes", "significant", "stable", "win_rate", "approve")))
+    return tuple(table)
 
 
 class IAIAuthority:
@@ -48,6 +115,9 @@ class IAIAuthority:
     - Provides clear reasoning for all decisions
     """
     
+    _DECISION_TABLE = _build_decision_table()
+    REVIEW_CACHE_SIZE = 256
+    
     def __init__(self, invariant_edge: float = 2.0, min_bets: int = 30):
         """
         Args:
@@ -57,6 +127,22 @@ class IAIAuthority:
         self.invariant_edge = invariant_edge
         self.min_bets = min_bets
         self.decisions: List[AuthorityDecision] = []
+        # Running tallies of self.decisions by outcome, kept in step by review()
+        self._counts: Dict[str, int] = {"ACCEPT": 0, "REJECT": 0, "DEFER": 0}
+        # LRU of decisions by (hypothesis, evaluation evidence); replays of the
+        # same pair reuse the record instead of rebuilding it
+        self._review_cache: "OrderedDict[Tuple, AuthorityDecision]" = OrderedDict()
+    
+    def _review_key(self, hypothesis: BettingHypothesis,
+                    evaluation: EvaluationResult) -> Tuple:
+        """Hashable key of everything a decision record depends on."""
+        return (
+            hypothesis.id, hypothesis.name, self.invariant_edge, self.min_bets,
+            evaluation.total_bets, evaluation.win_rate, evaluation.edge,
+            evaluation.edge_ci_lower, evaluation.edge_ci_upper, evaluation.p_value,
+            evaluation.edge_std, bool(evaluation.is_significant),
+            bool(evaluation.is_stable), bool(evaluation.passes_invariant),
+        )
     
     def review(self, hypothesis: BettingHypothesis, 
                evaluation: EvaluationResult) -> AuthorityDecision:
@@ -70,52 +156,60 @@ class IAIAuthority:
         Returns:
             AuthorityDecision with reasoning
         """
-        timestamp = datetime.utcnow().isoformat()
-        reasoning = []
+        key = self._review_key(hypothesis, evaluation)
+        decision_record = self._review_cache.get(key)
+        if decision_record is None:
+            decision_record = self._decide(hypothesis, evaluation)
+            self._review_cache[key] = decision_record
+            if len(self._review_cache) > self.REVIEW_CACHE_SIZE:
+                self._review_cache.popitem(last=False)
+        else:
+            self._review_cache.move_to_end(key)
+            # Each review gets its own audit record, stamped now
+            decision_record = replace(decision_record, timestamp=datetime.utcnow().isoformat())
+        decision = decision_record.decision
+        
+        # Record decision
+        self.decisions.append(decision_record)
+        self._counts[decision] += 1
         
-        # Check 1: Sufficient data
-        if evaluation.total_bets < self.min_bets:
-            decision = "DEFER"
-            reasoning.append(f"Insufficient data: {evaluation.total_bets} bets < {self.min_bets} required")
-            reasoning.append("Decision: Continue collecting data")
+        # Update hypothesis with decision
+        hypothesis.authority_decision = decision_record.to_dict()
+        if decision == "ACCEPT":
+            hypothesis.status = "ACCEPTED"
+        elif decision == "REJECT":
+            hypothesis.status = "REJECTED"
         else:
-            # Check 2: Invariant - Edge > threshold with 95% confidence
-            if not evaluation.passes_invariant:
-                decision = "REJECT"
-                reasoning.append(f"FAILS INVARIANT: Edge CI [{evaluation.edge_ci_lower:.2f}%, {evaluation.edge_ci_upper:.2f}%]")
-                reasoning.append(f"Required: Lower bound > {self.invariant_edge}% with 95% confidence")
-                
-                if evaluation.edge < 0:
-                    reasoning.append(f"Strategy has NEGATIVE edge ({evaluation.edge:.2f}%)")
-                elif evaluation.edge < self.invariant_edge:
-                    reasoning.append(f"Edge ({evaluation.edge:.2f}%) below threshold ({self.invariant_edge}%)")
-                else:
-                    reasoning.append("Confidence interval too wide - insufficient evidence")
-            
-            # Check 3: Statistical significance
-            elif not evaluation.is_significant:
-                decision = "REJECT"
-                reasoning.append(f"NOT statistically significant (p={evaluation.p_value:.4f})")
-                reasoning.append("Cannot distinguish from random chance")
-            
-            # Check 4: Stability across seasons
-            elif not evaluation.is_stable:
-                decision = "REJECT"
-                reasoning.append(f"UNSTABLE across seasons (std={evaluation.edge_std:.2f}%)")
-                reasoning.append("Performance varies too much - unreliable")
-            
-            # All checks passed
+            hypothesis.status = "EVALUATING"
+        
+        return decision_record
+    
+    def _decide(self, hypothesis: BettingHypothesis,
+                evaluation: EvaluationResult) -> AuthorityDecision:
+        """Apply the checks and build the decision record, timestamped now."""
+        # Checks: sufficient data, invariant (edge > threshold with 95%
+        # confidence), statistical significance, stability across seasons
+        mask = (
+            (_ENOUGH_DATA if evaluation.total_bets >= self.min_bets else 0)
+            | (_PASSES_INVARIANT if evaluation.passes_invariant else 0)
+            | (_SIGNIFICANT if evaluation.is_significant else 0)
+            | (_STABLE if evaluation.is_stable else 0)
+        )
+        decision, reason_ids = self._DECISION_TABLE[mask]
+        
+        if decision == "REJECT" and not mask & _PASSES_INVARIANT:
+            if evaluation.edge < 0:
+                reason_ids += ("negative_edge",)
+            elif evaluation.edge < self.invariant_edge:
+                reason_ids += ("below_threshold",)
             else:
-                decision = "ACCEPT"
-                reasoning.append(f"✓ PASSES INVARIANT: Edge = {evaluation.edge:.2f}% (CI: [{evaluation.edge_ci_lower:.2f}%, {evaluation.edge_ci_upper:.2f}%])")
-                reasoning.append(f"✓ Statistically significant (p={evaluation.p_value:.4f})")
-                reasoning.append(f"✓ Stable across seasons (std={evaluation.edge_std:.2f}%)")
-                reasoning.append(f"✓ Win rate: {evaluation.win_rate:.1f}% on {evaluation.total_bets} bets")
-                reasoning.append(f"Decision: APPROVE for deployment")
+                reason_ids += ("wide_ci",)
+        
+        fields = {"ev": evaluation, "min_bets": self.min_bets, "threshold": self.invariant_edge}
+        reasoning = [_REASONS[r].format(**fields) for r in reason_ids]
         
-        # Create decision record
-        decision_record = AuthorityDecision(
-            timestamp=timestamp,
+        return AuthorityDecision(
+            timestamp=datetime.utcnow().isoformat(),
             hypothesis_id=hypothesis.id,
             hypothesis_name=hypothesis.name,
             decision=decision,
@@ -129,20 +223,6 @@ class IAIAuthority:
             passes_invariant=evaluation.passes_invariant,
             invariant_threshold=self.invariant_edge
         )
-        
-        # Record decision
-        self.decisions.append(decision_record)
-        
-        # Update hypothesis with decision
-        hypothesis.authority_decision = asdict(decision_record)
-        if decision == "ACCEPT":
-            hypothesis.status = "ACCEPTED"
-        elif decision == "REJECT":
-            hypothesis.status = "REJECTED"
-        else:
-            hypothesis.status = "EVALUATING"
-        
-        return decision_record
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate a summary report of all decisions."""
@@ -155,9 +235,9 @@ class IAIAuthority:
                 "decisions": []
             }
         
-        accepted = sum(1 for d in self.decisions if d.decision == "ACCEPT")
-        rejected = sum(1 for d in self.decisions if d.decision == "REJECT")
-        deferred = sum(1 for d in self.decisions if d.decision == "DEFER")
+        accepted = self._counts["ACCEPT"]
+        rejected = self._counts["REJECT"]
+        deferred = self._counts["DEFER"]
         
         return {
             "total_decisions": len(self.decisions),
@@ -165,5 +245,24 @@ class IAIAuthority:
             "rejected": rejected,
             "deferred": deferred,
             "acceptance_rate": f"{(accepted / len(self.decisions) * 100):.1f}%" if self.decisions else "0%",
-            "decisions": [asdict(d) for d in self.decisions]
+            "decisions": [d.to_dict() for d in self.decisions]
         }
+    
+    def save_report(self, path):
+        """
+        Write generate_report() to ``path`` as JSON, atomically.
+        
+        The report goes to a temp file that is then renamed over ``path``, so
+        readers (or a parallel run) never see a half-written file.
+        """
+        path = Path(path)
+        report = self.generate_report()
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(report, default=_json_default, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(report, default=_json_default, indent=2).encode()
+        
+        # Per-process temp name: concurrent savers never share one
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
@@ -11,14 +11,51 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 from typing import List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 
 from .hypotheses import BettingHypothesis
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
-@dataclass
+
+# Odds column for each selection (Football-Data.co.uk Bet365 columns)
+_ODDS_COL = {"H": "B365H", "D": "B365D", "A": "B365A"}
+
+
+@lru_cache(maxsize=4096)
+def _t_critical(alpha: float, dof: int) -> float:
+    """Two-sided Student's t critical value, cached per (alpha, dof)."""
+    return float(stats.t.ppf(1 - alpha / 2, dof))
+
+
+def _simulate_bets(odds: np.ndarray, won: np.ndarray, stake_pct: float,
+                   initial_bankroll: float):
+    """
+    Simulate compounding bets in order.
+    
+    Each stake is stake_pct % of the running bankroll, so the bankroll path
+    is a cumulative product of per-bet growth factors.
+    
+    Returns:
+        (stakes, profits, final_bankroll)
+    """
+    p = stake_pct / 100
+    returns = np.where(won, odds - 1, -1.0)  # profit per unit staked
+    bankrolls = initial_bankroll * np.cumprod(1 + p * returns)
+    stakes = p * np.concatenate(([initial_bankroll], bankrolls[:-1]))
+    profits = stakes * returns
+    final_bankroll = bankrolls[-1] if len(bankrolls) else initial_bankroll
+    return stakes, profits, final_bankroll
+
+
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
-    """Result of hypothesis evaluation."""
+    """Result of hypothesis evaluation (immutable, no per-instance __dict__)."""
     hypothesis_id: str
     hypothesis_name: str
     
@@ -49,6 +86,12 @@ class EvaluationResult:
     # Overall assessment
     passes_invariant: bool  # Edge > 2.0% with 95% confidence
     recommendation: str  # ACCEPT, REJECT, NEEDS_MORE_DATA
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the fields (what asdict gives, without its recursive deep copy)."""
+        result = {f.name: getattr(self, f.name) for f in fields(self)}
+        result["season_edges"] = list(self.season_edges)
+        return result
 
 
 class BettingEvaluator:
@@ -63,6 +106,14 @@ class BettingEvaluator:
         self.invariant_edge = invariant_edge
         self.confidence_level = confidence_level
         self.alpha = 1 - confidence_level
+        
+        # Columns of the last DataFrame evaluated, as (DataFrame, arrays).
+        # Holding the DataFrame keeps its id() from being reused.
+        self._columns_cache = None
+    
+    def reset_cache(self):
+        """Forget cached match columns (call after mutating a DataFrame in place)."""
+        self._columns_cache = None
     
     def evaluate(self, hypothesis: BettingHypothesis, matches_df: pd.DataFrame,
                  initial_bankroll: float = 1000) -> EvaluationResult:
@@ -72,92 +123,95 @@ class BettingEvaluator:
         Args:
             hypothesis: Hypothesis to test
             matches_df: DataFrame with columns: Date, HomeTeam, AwayTeam, 
-                       FTR (Full Time Result), B365H, B365D, B365A (odds)
+                       FTR (Full Time Result), B365H, B365D, B365A (odds).
+                       A polars DataFrame or LazyFrame is also accepted.
             initial_bankroll: Starting bankroll for simulation
         
         Returns:
             EvaluationResult with all metrics
         """
+        columns = self._match_columns(matches_df)
+        
         # Filter qualifying matches
-        qualifying = self._filter_qualifying_matches(hypothesis, matches_df)
+        odds, won, season_codes = self._filter_qualifying_matches(hypothesis, columns)
+        
+        return self._evaluate_bets(hypothesis, odds, won, season_codes, initial_bankroll)
+    
+    def evaluate_many(self, hypotheses: List[BettingHypothesis], matches_df: pd.DataFrame,
+                      initial_bankroll: float = 1000) -> List[EvaluationResult]:
+        """
+        Evaluate several hypotheses against the same match data.
         
-        if len(qualifying) < 20:
-            return self._insufficient_data_result(hypothesis, len(qualifying))
+        Equivalent to calling evaluate() for each hypothesis, but the odds,
+        result and season columns are pulled out of the DataFrame once and
+        each hypothesis is filtered with plain array masks.
+        
+        Returns:
+            EvaluationResult per hypothesis, in the order given
+        """
+        columns = self._match_columns(matches_df)
+        
+        results = []
+        for hypothesis in hypotheses:
+            odds, won, season_codes = self._filter_qualifying_matches(hypothesis, columns)
+            results.append(self._evaluate_bets(hypothesis, odds, won, season_codes, initial_bankroll))
+        return results
+    
+    def _evaluate_bets(self, hypothesis: BettingHypothesis, odds: np.ndarray,
+                       won: np.ndarray, season_codes: np.ndarray,
+                       initial_bankroll: float) -> EvaluationResult:
+        """Compute all metrics for the qualifying bets (arrays in match order)."""
+        if len(odds) < 20:
+            return self._insufficient_data_result(hypothesis, len(odds))
         
         # Simulate bets
-        bankroll = initial_bankroll
-        bets = []
-        
-        for _, match in qualifying.iterrows():
-            # Determine odds based on selection
-            if hypothesis.selection == "H":
-                odds = match['B365H']
-                won = match['FTR'] == 'H'
-            elif hypothesis.selection == "D":
-                odds = match['B365D']
-                won = match['FTR'] == 'D'
-            else:  # "A"
-                odds = match['B365A']
-                won = match['FTR'] == 'A'
-            
-            # Calculate stake
-            stake = bankroll * (hypothesis.stake_pct / 100)
-            
-            # Record bet
-            profit = stake * (odds - 1) if won else -stake
-            bets.append({
-                'date': match['Date'],
-                'season': match.get('Season', 'unknown'),
-                'stake': stake,
-                'odds': odds,
-                'won': won,
-                'profit': profit
-            })
-            
-            bankroll += profit
-        
-        # Convert to DataFrame for analysis
-        bets_df = pd.DataFrame(bets)
+        stakes, profits, _ = _simulate_bets(odds, won, hypothesis.stake_pct, initial_bankroll)
         
         # Calculate metrics
-        total_bets = len(bets_df)
-        wins = bets_df['won'].sum()
+        total_bets = len(odds)
+        wins = int(won.sum())
         losses = total_bets - wins
         win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
         
-        total_staked = bets_df['stake'].sum()
-        total_return = bets_df[bets_df['won']]['stake'].sum() * bets_df[bets_df['won']]['odds'].mean() if wins > 0 else 0
-        profit = bets_df['profit'].sum()
+        total_staked = stakes.sum()
+        total_return = float((stakes[won] * odds[won]).sum())  # stake + winnings of won bets
+        profit = profits.sum()
         roi = (profit / total_staked * 100) if total_staked > 0 else 0
         
         # Calculate edge
-        avg_odds = bets_df['odds'].mean()
+        avg_odds = odds.mean()
         implied_prob = 1 / avg_odds * 100
         actual_win_rate = win_rate
         edge = actual_win_rate - implied_prob
         
         # Statistical significance (t-test)
-        returns = bets_df['profit'] / bets_df['stake']
-        t_stat, p_value = stats.ttest_1samp(returns, 0)
+        # One-sample t-test of mean return against 0, computed directly
+        # rather than through the stats.ttest_1samp wrapper
+        returns = profits / stakes
+        n = len(returns)
+        std_err = returns.std(ddof=1) / np.sqrt(n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = returns.mean() / std_err
+        p_value = 2 * stats.t.sf(abs(t_stat), n - 1)
         is_significant = p_value < self.alpha
         
         # 95% Confidence interval for edge
-        returns_pct = returns * 100
-        ci_margin = stats.t.ppf(1 - self.alpha/2, len(returns) - 1) * returns_pct.std() / np.sqrt(len(returns))
+        ci_margin = _t_critical(self.alpha, n - 1) * std_err * 100
         edge_ci_lower = edge - ci_margin
         edge_ci_upper = edge + ci_margin
         
-        # Stability analysis (by season)
-        season_edges = []
-        if 'season' in bets_df.columns:
-            for season in bets_df['season'].unique():
-                season_bets = bets_df[bets_df['season'] == season]
-                if len(season_bets) >= 5:
-                    season_win_rate = (season_bets['won'].sum() / len(season_bets) * 100)
-                    season_avg_odds = season_bets['odds'].mean()
-                    season_implied = 1 / season_avg_odds * 100
-                    season_edge = season_win_rate - season_implied
-                    season_edges.append(season_edge)
+        # Stability analysis (by season), aggregated with bincount in one
+        # pass over the pre-factorized season codes; missing season labels
+        # have code -1 and are left out.
+        labelled = season_codes >= 0
+        codes = season_codes[labelled]
+        season_bets = np.bincount(codes)
+        season_wins = np.bincount(codes, weights=won[labelled])
+        season_odds = np.bincount(codes, weights=odds[labelled])
+        enough = season_bets >= 5
+        season_win_rate = season_wins[enough] / season_bets[enough] * 100
+        season_implied = season_bets[enough] / season_odds[enough] * 100  # 1 / mean odds
+        season_edges = (season_win_rate - season_implied).tolist()
         
         edge_std = np.std(season_edges) if season_edges else 0
         is_stable = edge_std < 3.0  # Stable if std < 3%
@@ -195,23 +249,69 @@ class BettingEvaluator:
             recommendation=recommendation
         )
     
-    def _filter_qualifying_matches(self, hypothesis: BettingHypothesis, 
-                                   matches_df: pd.DataFrame) -> pd.DataFrame:
-        """Filter matches that qualify for the hypothesis."""
-        if hypothesis.selection == "H":
-            odds_col = 'B365H'
-        elif hypothesis.selection == "D":
-            odds_col = 'B365D'
+    def _match_columns(self, matches_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Pull the columns the evaluation needs out of the DataFrame as arrays.
+        
+        Keys are the odds columns, 'FTR', 'has_result' (FTR is not missing)
+        and 'season_codes': integer season codes in order of first appearance
+        (-1 for a missing label; all 0 if the data has no Season column).
+        For each odds column there are also '<col>_order', the indices that
+        sort it (missing odds last), and '<col>_sorted', the sorted odds, so
+        odds ranges become searchsorted lookups. The
+        arrays are cached for the last DataFrame seen, so evaluating several
+        hypotheses against the same data extracts them only once.
+        """
+        if self._columns_cache is not None and self._columns_cache[0] is matches_df:
+            return self._columns_cache[1]
+        
+        frame = matches_df
+        if POLARS_AVAILABLE and isinstance(matches_df, (pl.DataFrame, pl.LazyFrame)):
+            # Project to the columns used here before collecting, so a lazy
+            # scan of a wide Football-Data CSV only reads these
+            lf = matches_df.lazy()
+            needed = [*_ODDS_COL.values(), 'FTR']
+            if 'Season' in lf.collect_schema().names():
+                needed.append('Season')
+            frame = lf.select(needed).collect()
+        
+        columns = {col: np.asarray(frame[col].to_numpy(), dtype=float)
+                   for col in _ODDS_COL.values()}
+        columns['FTR'] = frame['FTR'].to_numpy()
+        if 'Season' in frame.columns:
+            columns['season_codes'] = pd.factorize(frame['Season'].to_numpy())[0]
         else:
-            odds_col = 'B365A'
+            columns['season_codes'] = np.zeros(len(frame), dtype=np.intp)
+        columns['has_result'] = pd.notna(columns['FTR'])
+        for col in _ODDS_COL.values():
+            order = np.argsort(columns[col], kind='stable')
+            columns[f'{col}_order'] = order
+            columns[f'{col}_sorted'] = columns[col][order]
+        self._columns_cache = (matches_df, columns)
+        return columns
+    
+    def _filter_qualifying_matches(self, hypothesis: BettingHypothesis,
+                                   columns: Dict[str, np.ndarray]):
+        """
+        Select the matches that qualify for the hypothesis.
         
-        mask = (
-            (matches_df[odds_col] >= hypothesis.odds_min) &
-            (matches_df[odds_col] <= hypothesis.odds_max) &
-            (matches_df['FTR'].notna())
-        )
+        Returns:
+            (odds, won, season_codes) arrays for the qualifying bets, in match order
+        """
+        odds_col = _ODDS_COL[hypothesis.selection]
+        odds = columns[odds_col]
+        order = columns[f'{odds_col}_order']
+        sorted_odds = columns[f'{odds_col}_sorted']
+        
+        # Matches in [odds_min, odds_max] are one contiguous run of the
+        # sorted order; put them back in match order for the simulation
+        start = np.searchsorted(sorted_odds, hypothesis.odds_min, side='left')
+        stop = np.searchsorted(sorted_odds, hypothesis.odds_max, side='right')
+        idx = np.sort(order[start:stop])
+        idx = idx[columns['has_result'][idx]]
         
-        return matches_df[mask].copy()
+        won = columns['FTR'][idx] == hypothesis.selection
+        return odds[idx], won, columns['season_codes'][idx]
     
     def _insufficient_data_result(self, hypothesis: BettingHypothesis, 
                                   bet_count: int) -> EvaluationResult:
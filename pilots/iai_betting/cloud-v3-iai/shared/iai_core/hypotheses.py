@@ -8,9 +8,17 @@ from dataclasses import dataclass
 from typing import List, Literal
 
 
-@dataclass
+# Position of each selection in (home_odds, draw_odds, away_odds)
+_ODDS_INDEX = {"H": 0, "D": 1, "A": 2}
+
+
+@dataclass(slots=True)
 class BettingHypothesis:
-    """A testable betting hypothesis."""
+    """A testable betting hypothesis.
+    
+    Not frozen: the Challenger, Orchestrator and Authority update status,
+    evaluation_result and authority_decision in place.
+    """
     
     id: str
     name: str
@@ -36,12 +44,7 @@ class BettingHypothesis:
     def qualifies(self, home_team: str, away_team: str, home_odds: float, 
                   draw_odds: float, away_odds: float) -> tuple[bool, float]:
         """Check if a match qualifies for this hypothesis and return odds."""
-        if self.selection == "H":
-            odds = home_odds
-        elif self.selection == "D":
-            odds = draw_odds
-        else:  # "A"
-            odds = away_odds
+        odds = (home_odds, draw_odds, away_odds)[_ODDS_INDEX[self.selection]]
         
         qualifies = self.odds_min <= odds <= self.odds_max
         return qualifies, odds
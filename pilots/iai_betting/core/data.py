@@ -8,11 +8,30 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import csv
+import os
+import tokenize
 import urllib.request
 import urllib.error
+import zipfile
+import zlib
 
+import numpy as np
 
-@dataclass
+# Arrays returned by FootballDataLoader.load_season_arrays
+SEASON_ARRAY_FIELDS = (
+    "home_odds", "draw_odds", "away_odds", "result",
+    "home_odds_order", "home_odds_sorted",
+)
+
+# What np.load raises on a truncated or corrupt .npz cache (a bad zip, a
+# cut-off member, a garbled array header)
+NPZ_CACHE_ERRORS = (
+    zipfile.BadZipFile, zlib.error, EOFError, KeyError, ValueError, OSError,
+    tokenize.TokenError,
+)
+
+
+@dataclass(slots=True)
 class BettingOdds:
     """Betting odds for a match."""
     # 1X2 odds (Home/Draw/Away)
@@ -48,7 +67,7 @@ class BettingOdds:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """A football match with result and odds."""
     date: datetime
@@ -120,6 +139,7 @@ class FootballDataLoader:
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._season_arrays: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
     
     def download_season(
         self,
@@ -138,8 +158,8 @@ class FootballDataLoader:
         Returns:
             Path to downloaded CSV file
         """
-        filename = f"{league}_{season}.csv"
-        filepath = self.data_dir / filename
+        filepath = self._season_path(league, season)
+        filename = filepath.name
         
         if filepath.exists() and not force:
             print(f"✓ Using cached: {filename}")
@@ -179,6 +199,14 @@ class FootballDataLoader:
         
         return filepath
     
+    def has_season(self, league: str, season: str) -> bool:
+        """True if the season's CSV is already in data_dir (nothing is downloaded)."""
+        return self._season_path(league, season).is_file()
+    
+    def _season_path(self, league: str, season: str) -> Path:
+        """Where a season's CSV is kept in data_dir."""
+        return self.data_dir / f"{league}_{season}.csv"
+    
     def load_season(
         self,
         league: str,
@@ -213,6 +241,71 @@ class FootballDataLoader:
         print(f"Loaded {len(matches)} matches from {league} {season}")
         return matches
     
+    def load_season_arrays(
+        self,
+        league: str,
+        season: str,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Load a season as NumPy arrays instead of Match objects.
+        
+        For consumers that only need odds and results. Arrays are kept per
+        (league, season) for the life of the loader, and saved next to the
+        CSV as .npz so later runs skip CSV parsing until the CSV changes.
+        
+        Args:
+            league: League code
+            season: Season string
+            
+        Returns:
+            Dict of "home_odds", "draw_odds", "away_odds" (float64) and
+            "result" ("H"/"D"/"A"), one entry per match in file order.
+            Also "home_odds_order" (stable argsort of home_odds) and
+            "home_odds_sorted" (home_odds in that order), so an odds range
+            can be found with np.searchsorted instead of a full scan.
+        """
+        key = (league, season)
+        if key in self._season_arrays:
+            return self._season_arrays[key]
+        
+        filepath = self.download_season(league, season)
+        stat = filepath.stat()
+        cache_path = filepath.with_suffix(".npz")
+        
+        arrays = None
+        if cache_path.exists():
+            try:
+                with np.load(cache_path) as cached:
+                    if (set(SEASON_ARRAY_FIELDS) <= set(cached.files)
+                            and int(cached["source_mtime_ns"]) == stat.st_mtime_ns
+                            and int(cached["source_size"]) == stat.st_size):
+                        arrays = {name: cached[name] for name in SEASON_ARRAY_FIELDS}
+            except NPZ_CACHE_ERRORS:
+                arrays = None  # Unreadable; re-parse the CSV and rewrite it
+        
+        if arrays is None:
+            matches = self._load_csv_file(filepath, league, season)
+            print(f"Loaded {len(matches)} matches from {league} {season}")
+            odds = [m.odds for m in matches]
+            arrays = {
+                "home_odds": np.array([o.home_odds for o in odds], dtype=np.float64),
+                "draw_odds": np.array([o.draw_odds for o in odds], dtype=np.float64),
+                "away_odds": np.array([o.away_odds for o in odds], dtype=np.float64),
+                "result": np.array([m.result for m in matches], dtype="U1"),
+            }
+            arrays["home_odds_order"] = np.argsort(arrays["home_odds"], kind="stable")
+            arrays["home_odds_sorted"] = arrays["home_odds"][arrays["home_odds_order"]]
+            tmp = cache_path.with_suffix(".npz.tmp")
+            with open(tmp, "wb") as f:
+                np.savez_compressed(
+                    f, **arrays,
+                    source_mtime_ns=stat.st_mtime_ns, source_size=stat.st_size,
+                )
+            os.replace(tmp, cache_path)
+        
+        self._season_arrays[key] = arrays
+        return arrays
+    
     def _parse_row(
         self,
         row: Dict[str, str],
@@ -26,7 +26,7 @@ def load_data():
 def save_data(data):
     """Save predictions database."""
     with open(PREDICTIONS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, separators=(',', ':')))
 
 
 def add_prediction():
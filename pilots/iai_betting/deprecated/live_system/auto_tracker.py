@@ -19,10 +19,28 @@ import csv
 import urllib.request
 import urllib.error
 import os
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 from io import StringIO
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich import box
+    RICH_AVAILABLE = True
+    _console = Console()
+except ImportError:
+    RICH_AVAILABLE = False
+
 # Paths
 SYSTEM_DIR = Path(__file__).parent
 PREDICTIONS_FILE = SYSTEM_DIR / "predictions.json"
@@ -30,6 +48,11 @@ CACHE_DIR = SYSTEM_DIR / "cache"
 
 # Football-Data.co.uk current season
 CURRENT_SEASON_URL = "https://www.football-data.co.uk/mmz4281/2526/E0.csv"
+CACHE_TTL_SECONDS = 3600
+CACHE_TTL_MAX_SECONDS = 24 * 3600
+
+# Prediction statuses that carry a profit/loss
+SETTLED = frozenset(('won', 'lost'))
 
 # Strategy parameters
 STRATEGY = {
@@ -42,6 +65,35 @@ STRATEGY = {
 }
 
 
+def json_loads(raw):
+    """Decode JSON bytes/str, with orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def json_dumps(obj):
+    """Encode to compact JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def replace_predictions(data):
+    """Atomically replace predictions.json, unless it already holds this data.
+    
+    Returns True if the file was written. The payload is compared with the
+    file on disk (size first, then bytes) rather than a cached digest, since
+    several live_system scripts write the same file.
+    """
+    payload = json_dumps(data)
+    if PREDICTIONS_FILE.exists() and PREDICTIONS_FILE.stat().st_size == len(payload):
+        if PREDICTIONS_FILE.read_bytes() == payload:
+            return False
+    tmp = PREDICTIONS_FILE.with_suffix('.json.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, PREDICTIONS_FILE)
+    return True
+
+
 def load_predictions():
     """Load predictions database."""
     if not PREDICTIONS_FILE.exists():
@@ -59,49 +111,99 @@ def load_predictions():
         return json.load(f)
 
 
-def save_predictions(data):
-    """Save predictions database."""
-    data['last_updated'] = datetime.now().isoformat()
+def save_predictions(data, now_iso=None):
+    """Save predictions database (underscore-prefixed runtime fields are not persisted)."""
+    data['last_updated'] = now_iso or datetime.now().isoformat()
+    out = dict(data)
+    out['predictions'] = [
+        {k: v for k, v in p.items() if not k.startswith('_')}
+        for p in data['predictions']
+    ]
+    # Compact encoding - use `python dashboard.py --pretty` to read it
     with open(PREDICTIONS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(out, separators=(',', ':')))
+
+
+def _cache_ttl(consecutive_304s):
+    """Adaptive TTL: doubles from 1h with each 304 in a row, capped at 24h."""
+    return min(CACHE_TTL_MAX_SECONDS, CACHE_TTL_SECONDS * 2 ** consecutive_304s)
 
 
 def fetch_current_season_data():
-    """Fetch current season data from Football-Data.co.uk."""
+    """Fetch current season data from Football-Data.co.uk.
+    
+    The CSV's mtime records when the cache was last fetched or revalidated.
+    Within the TTL the cache is used as-is; after it expires the server is
+    asked with If-None-Match/If-Modified-Since, and each 304 in a row
+    doubles the TTL (see _cache_ttl). A 200 resets it.
+    """
     CACHE_DIR.mkdir(exist_ok=True)
     cache_file = CACHE_DIR / "current_season.csv"
     cache_meta = CACHE_DIR / "cache_meta.json"
     
-    # Check if cache is fresh (less than 6 hours old)
+    # Within the base TTL the mtime alone proves freshness - no meta read
+    meta = {}
     use_cache = False
-    if cache_file.exists() and cache_meta.exists():
-        with open(cache_meta, 'r') as f:
-            meta = json.load(f)
-        cache_time = datetime.fromisoformat(meta['fetched_at'])
-        if datetime.now() - cache_time < timedelta(hours=6):
+    if cache_file.exists():
+        age = time.time() - cache_file.stat().st_mtime
+        if age < CACHE_TTL_SECONDS:
             use_cache = True
-            print("   ✓ Using cached data (< 6 hours old)")
+            print("   ✓ Using cached data")
+        elif cache_meta.exists():
+            meta = json.loads(cache_meta.read_text())
+            use_cache = age < _cache_ttl(meta.get('consecutive_304s', 0))
+            if use_cache:
+                print(f"   ✓ Using cached data ({meta.get('consecutive_304s', 0)} consecutive 304s)")
     
     if use_cache:
         with open(cache_file, 'r', encoding='utf-8') as f:
             content = f.read()
     else:
-        print("   ↓ Downloading latest data...")
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        if cache_file.exists():
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        if len(headers) > 1:
+            print("   ↓ Revalidating cached data...")
+        else:
+            print("   ↓ Downloading latest data...")
+        now_iso = datetime.now().isoformat()
         try:
-            req = urllib.request.Request(
-                CURRENT_SEASON_URL,
-                headers={'User-Agent': 'Mozilla/5.0'}
-            )
+            req = urllib.request.Request(CURRENT_SEASON_URL, headers=headers)
             with urllib.request.urlopen(req, timeout=30) as response:
                 content = response.read().decode('utf-8', errors='ignore')
+                meta = {
+                    'fetched_at': now_iso,
+                    'last_validated_at': now_iso,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'consecutive_304s': 0,
+                }
             
             # Save to cache
             with open(cache_file, 'w', encoding='utf-8') as f:
                 f.write(content)
-            with open(cache_meta, 'w') as f:
-                json.dump({'fetched_at': datetime.now().isoformat()}, f)
+            cache_meta.write_text(json.dumps(meta, separators=(',', ':')))
             print("   ✓ Downloaded and cached")
             
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                print(f"   ⚠️ HTTP error: {e}")
+                if not cache_file.exists():
+                    return []
+                print("   → Using older cached data")
+            else:
+                # Unchanged upstream: refresh mtime and stretch the TTL
+                meta['last_validated_at'] = now_iso
+                meta['consecutive_304s'] = meta.get('consecutive_304s', 0) + 1
+                cache_meta.write_text(json.dumps(meta, separators=(',', ':')))
+                os.utime(cache_file)
+                print(f"   ✓ Not modified ({meta['consecutive_304s']} consecutive 304s)")
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
         except urllib.error.URLError as e:
             print(f"   ⚠️ Network error: {e}")
             if cache_file.exists():
@@ -116,63 +218,80 @@ def fetch_current_season_data():
     reader = csv.DictReader(StringIO(content))
     
     for row in reader:
-        try:
-            # Parse date (DD/MM/YYYY format)
-            date_str = row.get('Date', '')
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    if len(year) == 2:
-                        year = '20' + year
-                    match_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                else:
-                    continue
-            else:
-                continue
-            
-            # Get odds
-            home_odds = float(row.get('B365H', 0) or row.get('BWH', 0) or 0)
-            
-            # Get result if available
-            result = row.get('FTR', '')  # H, D, A or empty
-            
-            matches.append({
-                'date': match_date,
-                'time': row.get('Time', '15:00'),
-                'home': row.get('HomeTeam', ''),
-                'away': row.get('AwayTeam', ''),
-                'home_odds': home_odds,
-                'result': result if result in ['H', 'D', 'A'] else None,
-                'home_goals': row.get('FTHG', ''),
-                'away_goals': row.get('FTAG', '')
-            })
-        except (ValueError, KeyError):
+        # Parse date (DD/MM/YYYY format)
+        match_date = _iso_date(row.get('Date') or '')
+        if match_date is None:
             continue
+        
+        # Get odds
+        home_odds = _safe_float(row.get('B365H') or row.get('BWH'))
+        
+        # Get result if available
+        result = row.get('FTR', '')  # H, D, A or empty
+        
+        home = row.get('HomeTeam', '')
+        away = row.get('AwayTeam', '')
+        matches.append({
+            '_key': get_match_key(home, away, match_date),
+            'date': match_date,
+            'time': row.get('Time', '15:00'),
+            'home': home,
+            'away': away,
+            'home_odds': home_odds,
+            'result': result if result in ['H', 'D', 'A'] else None,
+            'home_goals': row.get('FTHG', ''),
+            'away_goals': row.get('FTAG', '')
+        })
     
     return matches
 
 
+def _iso_date(date_str):
+    """Convert DD/MM/YY(YY) to YYYY-MM-DD, or None if the date is malformed."""
+    if date_str.count('/') != 2:
+        return None
+    day, month, year = date_str.split('/')
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+    y = int(year)
+    if len(year) == 2:
+        y += 2000
+    return f"{y:04d}-{int(month):02d}-{int(day):02d}"
+
+
+def _safe_float(value):
+    """Parse a decimal odds string; blank or malformed values become 0.0."""
+    if value and value.replace('.', '', 1).isdigit():
+        return float(value)
+    return 0.0
+
+
 def get_match_key(home, away, date):
     """Create unique key for a match."""
     return f"{date}_{home}_{away}".lower().replace(' ', '_')
 
 
-def process_matches(data, matches):
-    """Process matches: add new predictions, check results."""
-    now = datetime.now()
+def process_matches(data, matches, now_iso=None):
+    """Process matches: add new predictions, check results.
+    
+    ``now_iso`` is the run timestamp; every prediction created or settled in
+    this batch is stamped with it instead of re-reading the clock per match.
+    """
+    now = datetime.fromisoformat(now_iso) if now_iso else datetime.now()
+    now_iso = now_iso or now.isoformat()
     today = now.strftime("%Y-%m-%d")
     
-    existing_keys = {
-        get_match_key(p['home_team'], p['away_team'], p['match_date'])
-        for p in data['predictions']
-    }
+    # Normalise each stored prediction's key once; matches arrive pre-keyed
+    for p in data['predictions']:
+        if '_key' not in p:
+            p['_key'] = get_match_key(p['home_team'], p['away_team'], p['match_date'])
+    existing_keys = {p['_key'] for p in data['predictions']}
     
     new_predictions = 0
     results_updated = 0
     
     for match in matches:
-        match_key = get_match_key(match['home'], match['away'], match['date'])
+        match_key = match['_key']
         home_odds = match['home_odds']
         
         # Skip if no odds data
@@ -188,8 +307,9 @@ def process_matches(data, matches):
             potential_profit = stake * (home_odds - 1)
             
             prediction = {
+                "_key": match_key,
                 "id": len(data['predictions']) + 1,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now_iso,
                 "match_date": match['date'],
                 "match_time": match['time'] or "15:00",
                 "home_team": match['home'],
@@ -212,15 +332,14 @@ def process_matches(data, matches):
         # CHECK RESULT: Match has result and we have a pending prediction
         if match['result'] and match_key in existing_keys:
             for pred in data['predictions']:
-                pred_key = get_match_key(pred['home_team'], pred['away_team'], pred['match_date'])
-                if pred_key == match_key and pred['status'] == 'pending':
+                if pred['_key'] == match_key and pred['status'] == 'pending':
                     if match['result'] == 'H':
                         # We won!
                         profit = pred['stake'] * (pred['odds'] - 1)
                         pred['status'] = 'won'
                         pred['result'] = 'H'
                         pred['profit_loss'] = round(profit, 2)
-                        pred['settled_at'] = datetime.now().isoformat()
+                        pred['settled_at'] = now_iso
                         pred['score'] = f"{match['home_goals']}-{match['away_goals']}"
                         print(f"   ✅ WON: {pred['home_team']} beat {pred['away_team']} +£{profit:.2f}")
                     else:
@@ -228,7 +347,7 @@ def process_matches(data, matches):
                         pred['status'] = 'lost'
                         pred['result'] = match['result']
                         pred['profit_loss'] = -pred['stake']
-                        pred['settled_at'] = datetime.now().isoformat()
+                        pred['settled_at'] = now_iso
                         pred['score'] = f"{match['home_goals']}-{match['away_goals']}"
                         print(f"   ❌ LOST: {pred['home_team']} vs {pred['away_team']} -£{pred['stake']:.2f}")
                     
@@ -242,12 +361,17 @@ def update_summary(data):
     """Recalculate results summary."""
     predictions = data['predictions']
     
-    wins = sum(1 for p in predictions if p['status'] == 'won')
-    losses = sum(1 for p in predictions if p['status'] == 'lost')
-    pending = sum(1 for p in predictions if p['status'] == 'pending')
-    
-    profit = sum(p['profit_loss'] or 0 for p in predictions)
-    total_staked = sum(p['stake'] for p in predictions if p['status'] in ['won', 'lost'])
+    # Single pass: count statuses and accumulate settled stake/profit
+    counts = {'pending': 0, 'won': 0, 'lost': 0}
+    profit = 0
+    total_staked = 0
+    for p in predictions:
+        status = p['status']
+        counts[status] = counts.get(status, 0) + 1  # Tolerate unknown statuses
+        if status in SETTLED:
+            profit += p['profit_loss'] or 0
+            total_staked += p['stake']
+    wins, losses, pending = counts['won'], counts['lost'], counts['pending']
     roi = (profit / total_staked * 100) if total_staked > 0 else 0
     
     data['results_summary'] = {
@@ -262,116 +386,145 @@ def update_summary(data):
     data['bankroll']['current'] = round(data['bankroll']['initial'] + profit, 2)
 
 
-def display_status(data):
-    """Display current status."""
-    try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich import box
-        
-        console = Console()
-        
-        # Header
+def partition_predictions(predictions, recent_n=5):
+    """Split predictions into pending bets and the last ``recent_n`` settled ones in one pass."""
+    pending = []
+    recent = deque(maxlen=recent_n)
+    for p in predictions:
+        if p['status'] == 'pending':
+            pending.append(p)
+        elif p['status'] in SETTLED:
+            recent.append(p)
+    return pending, list(recent)
+
+
+# Table schemas: (header, add_column kwargs)
+PENDING_COLUMNS = [
+    ("Date", {"style": "cyan"}),
+    ("Match", {}),
+    ("Odds", {"justify": "right"}),
+    ("Stake", {"justify": "right"}),
+    ("Pot. Win", {"justify": "right", "style": "green"}),
+]
+RECENT_COLUMNS = [
+    ("Date", {"style": "dim"}),
+    ("Match", {}),
+    ("Odds", {}),
+    ("Result", {}),
+    ("P/L", {"justify": "right"}),
+]
+
+
+def make_table(title, columns):
+    """Create a Rich table with the given column schema."""
+    table = Table(title=title, box=box.ROUNDED)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
+
+
+def _render_rich(data, console):
+    """Render status with Rich."""
+    # Header
+    console.print()
+    console.print(Panel.fit(
+        "[bold cyan]🤖 IAI AUTOMATED BETTING TRACKER[/bold cyan]",
+        border_style="cyan"
+    ))
+    
+    # Strategy
+    console.print(f"\n[bold]Strategy:[/bold] HOME WIN @ {STRATEGY['odds_min']}-{STRATEGY['odds_max']} odds")
+    
+    # Bankroll
+    bankroll = data['bankroll']
+    profit = bankroll['current'] - bankroll['initial']
+    profit_color = "green" if profit >= 0 else "red"
+    
+    console.print(f"\n[bold]💰 Bankroll:[/bold] £{bankroll['current']:,.2f} ([{profit_color}]{profit:+.2f}[/{profit_color}])")
+    
+    # Summary
+    s = data['results_summary']
+    if s['wins'] + s['losses'] > 0:
+        win_rate = s['wins'] / (s['wins'] + s['losses']) * 100
+    else:
+        win_rate = 0
+    
+    roi_color = "green" if s['roi_pct'] >= 0 else "red"
+    console.print(f"[bold]📊 Record:[/bold] {s['wins']}W - {s['losses']}L ({s['pending']} pending)")
+    console.print(f"[bold]📈 Win Rate:[/bold] {win_rate:.1f}% | [bold]ROI:[/bold] [{roi_color}]{s['roi_pct']:+.1f}%[/{roi_color}]")
+    
+    pending, recent = partition_predictions(data['predictions'], recent_n=5)
+    
+    # Pending bets
+    if pending:
         console.print()
-        console.print(Panel.fit(
-            "[bold cyan]🤖 IAI AUTOMATED BETTING TRACKER[/bold cyan]",
-            border_style="cyan"
-        ))
-        
-        # Strategy
-        console.print(f"\n[bold]Strategy:[/bold] HOME WIN @ {STRATEGY['odds_min']}-{STRATEGY['odds_max']} odds")
-        
-        # Bankroll
-        bankroll = data['bankroll']
-        profit = bankroll['current'] - bankroll['initial']
-        profit_color = "green" if profit >= 0 else "red"
-        
-        console.print(f"\n[bold]💰 Bankroll:[/bold] £{bankroll['current']:,.2f} ([{profit_color}]{profit:+.2f}[/{profit_color}])")
-        
-        # Summary
-        s = data['results_summary']
-        if s['wins'] + s['losses'] > 0:
-            win_rate = s['wins'] / (s['wins'] + s['losses']) * 100
-        else:
-            win_rate = 0
-        
-        roi_color = "green" if s['roi_pct'] >= 0 else "red"
-        console.print(f"[bold]📊 Record:[/bold] {s['wins']}W - {s['losses']}L ({s['pending']} pending)")
-        console.print(f"[bold]📈 Win Rate:[/bold] {win_rate:.1f}% | [bold]ROI:[/bold] [{roi_color}]{s['roi_pct']:+.1f}%[/{roi_color}]")
-        
-        # Pending bets
-        pending = [p for p in data['predictions'] if p['status'] == 'pending']
-        if pending:
-            console.print()
-            table = Table(title=f"⏳ Pending Bets ({len(pending)})", box=box.ROUNDED)
-            table.add_column("Date", style="cyan")
-            table.add_column("Match")
-            table.add_column("Odds", justify="right")
-            table.add_column("Stake", justify="right")
-            table.add_column("Pot. Win", justify="right", style="green")
-            
-            for p in pending:
-                table.add_row(
-                    p['match_date'],
-                    f"{p['home_team']} vs {p['away_team']}",
-                    f"{p['odds']:.2f}",
-                    f"£{p['stake']:.2f}",
-                    f"£{p['potential_profit']:.2f}"
-                )
-            console.print(table)
-        
-        # Recent results
-        settled = [p for p in data['predictions'] if p['status'] in ['won', 'lost']]
-        if settled:
-            console.print()
-            table = Table(title="📋 Recent Results (last 5)", box=box.ROUNDED)
-            table.add_column("Date", style="dim")
-            table.add_column("Match")
-            table.add_column("Odds")
-            table.add_column("Result")
-            table.add_column("P/L", justify="right")
-            
-            for p in settled[-5:]:
-                if p['status'] == 'won':
-                    result_str = f"[green]✅ {p.get('score', 'W')}[/green]"
-                    pl_str = f"[green]+£{p['profit_loss']:.2f}[/green]"
-                else:
-                    result_str = f"[red]❌ {p.get('score', 'L')}[/red]"
-                    pl_str = f"[red]-£{abs(p['profit_loss']):.2f}[/red]"
-                
-                table.add_row(
-                    p['match_date'],
-                    f"{p['home_team']} vs {p['away_team']}",
-                    f"{p['odds']:.2f}",
-                    result_str,
-                    pl_str
-                )
-            console.print(table)
-        
-        # Last updated
-        if data.get('last_updated'):
-            console.print(f"\n[dim]Last updated: {data['last_updated'][:19]}[/dim]")
-        
+        table = make_table(f"⏳ Pending Bets ({len(pending)})", PENDING_COLUMNS)
+        for p in pending:
+            table.add_row(
+                p['match_date'],
+                f"{p['home_team']} vs {p['away_team']}",
+                f"{p['odds']:.2f}",
+                f"£{p['stake']:.2f}",
+                f"£{p['potential_profit']:.2f}"
+            )
+        console.print(table)
+    
+    # Recent results
+    if recent:
         console.print()
-        
-    except ImportError:
-        # Plain text fallback
-        print("\n" + "="*60)
-        print("🤖 IAI AUTOMATED BETTING TRACKER")
-        print("="*60)
-        s = data['results_summary']
-        print(f"\nBankroll: £{data['bankroll']['current']:,.2f}")
-        print(f"Record: {s['wins']}W - {s['losses']}L ({s['pending']} pending)")
-        print(f"ROI: {s['roi_pct']:+.1f}%")
-        print("="*60)
+        table = make_table("📋 Recent Results (last 5)", RECENT_COLUMNS)
+        for p in recent:
+            if p['status'] == 'won':
+                result_str = f"[green]✅ {p.get('score', 'W')}[/green]"
+                pl_str = f"[green]+£{p['profit_loss']:.2f}[/green]"
+            else:
+                result_str = f"[red]❌ {p.get('score', 'L')}[/red]"
+                pl_str = f"[red]-£{abs(p['profit_loss']):.2f}[/red]"
+            
+            table.add_row(
+                p['match_date'],
+                f"{p['home_team']} vs {p['away_team']}",
+                f"{p['odds']:.2f}",
+                result_str,
+                pl_str
+            )
+        console.print(table)
+    
+    # Last updated
+    if data.get('last_updated'):
+        console.print(f"\n[dim]Last updated: {data['last_updated'][:19]}[/dim]")
+    
+    console.print()
+
+
+def _render_plain(data):
+    """Plain text fallback."""
+    print("\n" + "="*60)
+    print("🤖 IAI AUTOMATED BETTING TRACKER")
+    print("="*60)
+    s = data['results_summary']
+    print(f"\nBankroll: £{data['bankroll']['current']:,.2f}")
+    print(f"Record: {s['wins']}W - {s['losses']}L ({s['pending']} pending)")
+    print(f"ROI: {s['roi_pct']:+.1f}%")
+    print("="*60)
+
+
+def display_status(data):
+    """Display current status."""
+    if RICH_AVAILABLE:
+        _render_rich(data, _console)
+    else:
+        _render_plain(data)
 
 
 def run():
     """Main automated run."""
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     print("\n🤖 IAI AUTOMATED BETTING SYSTEM")
     print("="*50)
-    print(f"   Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    print(f"   Time: {now.strftime('%Y-%m-%d %H:%M')}")
     print(f"   Strategy: Home @ {STRATEGY['odds_min']}-{STRATEGY['odds_max']} odds")
     print()
     
@@ -391,7 +544,7 @@ def run():
     
     # Process matches
     print("\n3️⃣  Processing matches...")
-    new_preds, updated = process_matches(data, matches)
+    new_preds, updated = process_matches(data, matches, now_iso)
     
     if new_preds == 0 and updated == 0:
         print("   ✓ No changes (all up to date)")
@@ -403,7 +556,7 @@ def run():
     
     # Save
     print("\n4️⃣  Saving...")
-    save_predictions(data)
+    save_predictions(data, now_iso)
     print("   ✓ Saved to predictions.json")
     
     # Display status
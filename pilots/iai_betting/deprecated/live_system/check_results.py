@@ -11,6 +11,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from auto_tracker import SETTLED
+
 PREDICTIONS_FILE = Path(__file__).parent / "predictions.json"
 
 
@@ -23,7 +25,7 @@ def load_data():
 def save_data(data):
     """Save predictions database."""
     with open(PREDICTIONS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, separators=(',', ':')))
 
 
 def update_summary(data):
@@ -31,12 +33,17 @@ def update_summary(data):
     predictions = data['predictions']
     
     total = len(predictions)
-    wins = sum(1 for p in predictions if p['status'] == 'won')
-    losses = sum(1 for p in predictions if p['status'] == 'lost')
-    pending = sum(1 for p in predictions if p['status'] == 'pending')
-    
-    profit = sum(p['profit_loss'] or 0 for p in predictions)
-    total_staked = sum(p['stake'] for p in predictions if p['status'] in ['won', 'lost'])
+    # Single pass: count statuses and accumulate settled stake/profit
+    counts = {'pending': 0, 'won': 0, 'lost': 0}
+    profit = 0
+    total_staked = 0
+    for p in predictions:
+        status = p['status']
+        counts[status] = counts.get(status, 0) + 1  # Tolerate unknown statuses
+        if status in SETTLED:
+            profit += p['profit_loss'] or 0
+            total_staked += p['stake']
+    wins, losses, pending = counts['won'], counts['lost'], counts['pending']
     roi = (profit / total_staked * 100) if total_staked > 0 else 0
     
     data['results_summary'] = {
@@ -61,6 +68,8 @@ def check_results():
         print("\n✅ No pending predictions to check")
         return
     
+    settled_at = datetime.now().isoformat()
+    
     print("\n" + "="*60)
     print(f"📊 CHECK RESULTS ({len(pending)} pending)")
     print("="*60)
@@ -84,14 +93,14 @@ def check_results():
             pred['status'] = 'won'
             pred['result'] = 'H'
             pred['profit_loss'] = round(profit, 2)
-            pred['settled_at'] = datetime.now().isoformat()
+            pred['settled_at'] = settled_at
             print(f"   ✅ WON! +£{profit:.2f}")
         elif result in ['a', 'd']:
             # Away win or draw - we lost
             pred['status'] = 'lost'
             pred['result'] = 'A' if result == 'a' else 'D'
             pred['profit_loss'] = -pred['stake']
-            pred['settled_at'] = datetime.now().isoformat()
+            pred['settled_at'] = settled_at
             print(f"   ❌ Lost -£{pred['stake']:.2f}")
         else:
             print("   ⚠️ Invalid input, skipping")
@@ -5,25 +5,45 @@ Shows historical performance and pending bets.
 
 Usage:
     python dashboard.py
+    python dashboard.py --pretty   # dump predictions.json formatted
 """
 
+import argparse
 import json
 from datetime import datetime
 from pathlib import Path
 
 try:
     from rich.console import Console
-    from rich.table import Table
     from rich.panel import Panel
-    from rich.layout import Layout
-    from rich import box
     RICH_AVAILABLE = True
+    _console = Console()
 except ImportError:
     RICH_AVAILABLE = False
     print("Note: Install 'rich' for better formatting: pip install rich")
 
+from auto_tracker import make_table, partition_predictions
+
 PREDICTIONS_FILE = Path(__file__).parent / "predictions.json"
 
+# Table schemas: (header, add_column kwargs)
+PENDING_COLUMNS = [
+    ("#", {"style": "dim"}),
+    ("Date", {}),
+    ("Match", {}),
+    ("Odds", {}),
+    ("Stake", {}),
+    ("Pot. Profit", {}),
+]
+RECENT_COLUMNS = [
+    ("#", {"style": "dim"}),
+    ("Date", {}),
+    ("Match", {}),
+    ("Odds", {}),
+    ("Result", {}),
+    ("P/L", {}),
+]
+
 
 def load_data():
     """Load predictions database."""
@@ -31,6 +51,32 @@ def load_data():
         return json.load(f)
 
 
+def current_streak(recent, predictions):
+    """Return (status, length) of the current run of identical results.
+    
+    Reads backwards from the ``recent`` tail and stops at the first change;
+    only a streak spanning the whole tail needs a walk over ``predictions``.
+    """
+    if not recent:
+        return None, 0
+    streak_type = recent[-1]['status']
+    count = 1
+    for p in reversed(recent[:-1]):
+        if p['status'] != streak_type:
+            return streak_type, count
+        count += 1
+    
+    # Whole tail is one streak - keep counting over the full history
+    count = 0
+    for p in reversed(predictions):
+        if p['status'] == 'pending':
+            continue
+        if p['status'] != streak_type:
+            break
+        count += 1
+    return streak_type, count
+
+
 def plain_dashboard():
     """Simple text dashboard without Rich."""
     data = load_data()
@@ -61,8 +107,9 @@ def plain_dashboard():
         print(f"   Win rate: {win_rate:.1f}%")
     print(f"   ROI: {summary['roi_pct']:+.1f}%")
     
+    pending, recent = partition_predictions(predictions, recent_n=10)
+    
     # Pending bets
-    pending = [p for p in predictions if p['status'] == 'pending']
     if pending:
         print(f"\n⏳ PENDING BETS ({len(pending)})")
         print("-"*70)
@@ -72,11 +119,10 @@ def plain_dashboard():
             print(f"       HOME @ {p['odds']} {qual} | Stake: £{p['stake']:.2f}")
     
     # Recent results
-    settled = [p for p in predictions if p['status'] in ['won', 'lost']]
-    if settled:
+    if recent:
         print(f"\n📋 RECENT RESULTS (last 10)")
         print("-"*70)
-        for p in settled[-10:]:
+        for p in recent:
             status = "✅ WON" if p['status'] == 'won' else "❌ LOST"
             print(f"  #{p['id']} | {p['match_date']} | {p['home_team']} vs {p['away_team']}")
             print(f"       {status} | P/L: £{p['profit_loss']:+.2f}")
@@ -86,7 +132,7 @@ def plain_dashboard():
 
 def rich_dashboard():
     """Rich formatted dashboard."""
-    console = Console()
+    console = _console
     data = load_data()
     strategy = data['strategy']
     bankroll = data['bankroll']
@@ -133,17 +179,11 @@ def rich_dashboard():
     """
     console.print(Panel(perf_text.strip(), title="📊 Performance", border_style="blue"))
     
+    pending, recent = partition_predictions(predictions, recent_n=10)
+    
     # Pending bets table
-    pending = [p for p in predictions if p['status'] == 'pending']
     if pending:
-        table = Table(title=f"⏳ Pending Bets ({len(pending)})", box=box.ROUNDED)
-        table.add_column("#", style="dim")
-        table.add_column("Date")
-        table.add_column("Match")
-        table.add_column("Odds")
-        table.add_column("Stake")
-        table.add_column("Pot. Profit")
-        
+        table = make_table(f"⏳ Pending Bets ({len(pending)})", PENDING_COLUMNS)
         for p in pending:
             qual = "✅" if p['qualifies'] else "⚠️"
             table.add_row(
@@ -159,17 +199,9 @@ def rich_dashboard():
         console.print("\n[dim]No pending bets[/dim]")
     
     # Recent results table
-    settled = [p for p in predictions if p['status'] in ['won', 'lost']]
-    if settled:
-        table = Table(title=f"📋 Recent Results (last 10)", box=box.ROUNDED)
-        table.add_column("#", style="dim")
-        table.add_column("Date")
-        table.add_column("Match")
-        table.add_column("Odds")
-        table.add_column("Result")
-        table.add_column("P/L")
-        
-        for p in settled[-10:]:
+    if recent:
+        table = make_table("📋 Recent Results (last 10)", RECENT_COLUMNS)
+        for p in recent:
             if p['status'] == 'won':
                 result_str = "[green]✅ WON[/green]"
                 pl_str = f"[green]+£{p['profit_loss']:.2f}[/green]"
@@ -188,28 +220,25 @@ def rich_dashboard():
         console.print(table)
     
     # Win streak / Loss streak
-    if settled:
-        current_streak = 0
-        streak_type = None
-        for p in reversed(settled):
-            if streak_type is None:
-                streak_type = p['status']
-                current_streak = 1
-            elif p['status'] == streak_type:
-                current_streak += 1
-            else:
-                break
-        
+    if recent:
+        streak_type, streak_len = current_streak(recent, predictions)
         if streak_type == 'won':
-            console.print(f"\n[green]🔥 Current win streak: {current_streak}[/green]")
+            console.print(f"\n[green]🔥 Current win streak: {streak_len}[/green]")
         else:
-            console.print(f"\n[red]📉 Current loss streak: {current_streak}[/red]")
+            console.print(f"\n[red]📉 Current loss streak: {streak_len}[/red]")
     
     console.print()
 
 
 def main():
-    if RICH_AVAILABLE:
+    parser = argparse.ArgumentParser(description="Live betting dashboard")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Print predictions.json (stored compact) as indented JSON")
+    args = parser.parse_args()
+    
+    if args.pretty:
+        print(json.dumps(load_data(), indent=2))
+    elif RICH_AVAILABLE:
         rich_dashboard()
     else:
         plain_dashboard()
@@ -12,12 +12,31 @@ Usage:
     python fetch_fixtures.py
 """
 
-import json
-import urllib.request
-import urllib.error
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from auto_tracker import json_dumps, json_loads, replace_predictions
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx's HTTP/2 support)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Errors that mean "this round could not be fetched", for either client
+HTTP_ERRORS = (requests.RequestException, ValueError)
+if HTTPX_AVAILABLE:
+    HTTP_ERRORS += (httpx.HTTPError,)
+
 PREDICTIONS_FILE = Path(__file__).parent / "predictions.json"
 
 # Free football API (no odds, but has fixtures)
@@ -26,15 +45,27 @@ FOOTBALL_API = "https://www.thesportsdb.com/api/v1/json/3/eventsround.php"
 # Premier League ID in TheSportsDB
 PREMIER_LEAGUE_ID = "4328"
 
+# Concurrent round requests (kept modest for the free API's rate limit)
+FETCH_WORKERS = 8
+
+# Per-round response cache; completed rounds no longer change upstream
+SPORTSDB_CACHE_DIR = Path(__file__).parent / "cache" / "sportsdb"
+ROUND_TTL_SECONDS = 3600
+COMPLETED_ROUND_TTL_SECONDS = 30 * 24 * 3600
+
+# How many upcoming fixtures fetch_upcoming_fixtures returns
+UPCOMING_FIXTURES_SHOWN = 10
+
 
 def load_data():
     """Load predictions database."""
-    with open(PREDICTIONS_FILE, 'r') as f:
-        return json.load(f)
+    with open(PREDICTIONS_FILE, 'rb') as f:
+        return json_loads(f.read())
 
 
+@lru_cache(maxsize=1)
 def get_current_season():
-    """Get current season string (e.g., '2025-2026')."""
+    """Get current season string (e.g., '2025-2026'), computed once per run."""
     now = datetime.now()
     if now.month >= 8:  # Season starts in August
         return f"{now.year}-{now.year + 1}"
@@ -42,54 +73,123 @@ def get_current_season():
         return f"{now.year - 1}-{now.year}"
 
 
+def _make_session():
+    """HTTP client for TheSportsDB.
+    
+    With httpx (and h2) installed this is an HTTP/2 client, so the parallel
+    round requests are multiplexed over one connection. Otherwise it falls
+    back to a requests session with keep-alive pooling and retries. Both
+    expose the same get()/raise_for_status()/content calls used below.
+    """
+    if HTTPX_AVAILABLE:
+        return httpx.Client(
+            headers={'User-Agent': 'Mozilla/5.0'},
+            transport=httpx.HTTPTransport(http2=True, retries=3),
+        )
+    
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0'
+    return session
+
+
+def _kickoff_key(event):
+    """Kick-off as a sortable "YYYY-MM-DD HH:MM" string, or None if malformed."""
+    match_date = event.get('dateEvent') or ''
+    match_time = (event.get('strTime') or '15:00:00')[:5]
+    if len(match_date) != 10 or len(match_time) != 5:
+        return None
+    return f"{match_date} {match_time}"
+
+
+def _round_completed(events, now_key):
+    """True once every fixture in a (non-empty) round has kicked off."""
+    if not events:
+        return False
+    keys = [_kickoff_key(event) for event in events]
+    return all(key and key <= now_key for key in keys)
+
+
+def _fetch_round(session, season, round_num, now_key):
+    """Fetch one round's events ([] if none), or None if the request failed.
+    
+    Responses are cached per (season, round) on disk. An open round is
+    refetched after an hour; a completed round is kept for 30 days. If the
+    request fails, an expired cache entry is still better than nothing. A
+    cache file that can't be decoded counts as a miss and is overwritten.
+    """
+    cache_file = SPORTSDB_CACHE_DIR / f"{season}_r{round_num:02d}.json"
+    cached = None
+    if cache_file.exists():
+        try:
+            cached = json_loads(cache_file.read_bytes())
+        except ValueError:
+            cached = None  # Truncated or corrupt; refetch
+    if cached is not None:
+        ttl = COMPLETED_ROUND_TTL_SECONDS if _round_completed(cached, now_key) else ROUND_TTL_SECONDS
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return cached
+    
+    try:
+        response = session.get(
+            FOOTBALL_API,
+            params={'id': PREMIER_LEAGUE_ID, 'r': round_num, 's': season},
+            timeout=10
+        )
+        response.raise_for_status()
+        events = json_loads(response.content).get('events') or []
+    except HTTP_ERRORS:
+        return cached
+    
+    # Write then rename, so an interrupted write never leaves a partial file
+    tmp = cache_file.with_suffix('.json.tmp')
+    tmp.write_bytes(json_dumps(events))
+    os.replace(tmp, cache_file)
+    return events
+
+
 def fetch_upcoming_fixtures():
     """Fetch upcoming Premier League fixtures."""
     print("\n🔍 Fetching upcoming fixtures...")
     print("   (Using TheSportsDB free API - no odds data)")
     
     season = get_current_season()
+    rounds = range(1, 39)
+    
+    # Zero-padded "YYYY-MM-DD HH:MM" strings order the same as the datetimes
+    # they encode, so upcoming matches are found by string comparison
+    now_key = datetime.now().strftime("%Y-%m-%d %H:%M")
+    
+    # All rounds in parallel over one pooled session; results keep round order
+    SPORTSDB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with _make_session() as session, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        results = list(executor.map(lambda r: _fetch_round(session, season, r, now_key), rounds))
+    
+    failed = sum(1 for events in results if events is None)
+    if failed:
+        print(f"   ⚠️ Network error: {failed} of {len(rounds)} rounds could not be fetched")
     
-    # Try to get next few rounds
     fixtures = []
+    for round_num, events in zip(rounds, results):
+        for event in events or []:
+            kickoff = _kickoff_key(event)
+            
+            # Check if match is upcoming
+            if kickoff and kickoff > now_key:
+                match_date, match_time = kickoff.split(' ')
+                fixtures.append({
+                    'date': match_date,
+                    'time': match_time,
+                    'home': event.get('strHomeTeam', ''),
+                    'away': event.get('strAwayTeam', ''),
+                    'round': round_num
+                })
     
-    for round_num in range(1, 39):
-        url = f"{FOOTBALL_API}?id={PREMIER_LEAGUE_ID}&r={round_num}&s={season}"
-        
-        try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                
-                if data.get('events'):
-                    for event in data['events']:
-                        match_date = event.get('dateEvent', '')
-                        match_time = event.get('strTime', '15:00:00')[:5]
-                        
-                        # Check if match is upcoming
-                        try:
-                            match_dt = datetime.strptime(f"{match_date} {match_time}", "%Y-%m-%d %H:%M")
-                            if match_dt > datetime.now():
-                                fixtures.append({
-                                    'date': match_date,
-                                    'time': match_time,
-                                    'home': event.get('strHomeTeam', ''),
-                                    'away': event.get('strAwayTeam', ''),
-                                    'round': round_num
-                                })
-                        except:
-                            pass
-                    
-                    # If we found upcoming matches, we can stop
-                    if len(fixtures) >= 10:
-                        break
-                        
-        except urllib.error.URLError as e:
-            print(f"   ⚠️ Network error: {e}")
-            break
-        except Exception as e:
-            continue
-    
-    return fixtures
+    # Only the next few matches are offered for odds entry
+    fixtures.sort(key=lambda f: (f['date'], f['time']))
+    return fixtures[:UPCOMING_FIXTURES_SHOWN]
 
 
 def display_fixtures(fixtures):
@@ -107,7 +207,7 @@ def display_fixtures(fixtures):
     print(f"Looking for: HOME WIN @ {strategy['odds_min']}-{strategy['odds_max']} odds")
     print("="*60)
     
-    for i, f in enumerate(fixtures[:10], 1):
+    for i, f in enumerate(fixtures, 1):
         print(f"\n{i}. {f['date']} {f['time']}")
         print(f"   {f['home']} vs {f['away']}")
     
@@ -163,8 +263,7 @@ def display_fixtures(fixtures):
                 if confirm == 'y':
                     data['predictions'].append(prediction)
                     data['results_summary']['pending'] += 1
-                    with open(PREDICTIONS_FILE, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    replace_predictions(data)
                     print(f"✅ Prediction #{prediction['id']} saved!")
         except (ValueError, IndexError):
             print("Invalid input")
@@ -8,14 +8,19 @@ Usage:
     python validate_current_season.py
 """
 
-import csv
-import json
-from datetime import datetime
+import sys
 from pathlib import Path
-from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from auto_tracker import replace_predictions
 
 CACHE_FILE = Path(__file__).parent / "cache" / "current_season.csv"
-PREDICTIONS_FILE = Path(__file__).parent / "predictions.json"
+
+# Columns load_matches needs; the score columns are optional
+REQUIRED_COLUMNS = ['Date', 'HomeTeam', 'AwayTeam', 'FTR', 'B365H']
+SCORE_COLUMNS = ['FTHG', 'FTAG']
 
 STRATEGY = {
     "selection": "H",
@@ -26,128 +31,130 @@ STRATEGY = {
 
 
 def load_matches():
-    """Load current season matches from cache."""
+    """Load played current-season matches (with home odds and a result) from cache."""
     if not CACHE_FILE.exists():
         print("❌ No cached data. Run auto_tracker.py first.")
-        return []
-    
-    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    matches = []
-    reader = csv.DictReader(StringIO(content))
-    
-    for row in reader:
-        try:
-            date_str = row.get('Date', '')
-            if '/' in date_str:
-                parts = date_str.split('/')
-                day, month, year = parts
-                if len(year) == 2:
-                    year = '20' + year
-                match_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-            else:
-                continue
-            
-            home_odds = float(row.get('B365H', 0) or 0)
-            result = row.get('FTR', '')
-            
-            if home_odds > 0 and result in ['H', 'D', 'A']:
-                matches.append({
-                    'date': match_date,
-                    'home': row.get('HomeTeam', ''),
-                    'away': row.get('AwayTeam', ''),
-                    'home_odds': home_odds,
-                    'result': result,
-                    'score': f"{row.get('FTHG', '')}-{row.get('FTAG', '')}"
-                })
-        except (ValueError, KeyError):
-            continue
-    
-    return matches
+        return pd.DataFrame()
+    
+    df = pd.read_csv(
+        CACHE_FILE,
+        usecols=lambda col: col in REQUIRED_COLUMNS or col in SCORE_COLUMNS,
+        dtype={'FTHG': str, 'FTAG': str},
+        encoding='utf-8-sig',
+    )
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        print(f"❌ Cached data is missing columns {missing}. Run auto_tracker.py to refresh it.")
+        return pd.DataFrame()
+    df = df.reindex(columns=REQUIRED_COLUMNS + SCORE_COLUMNS)
+    home_odds = pd.to_numeric(df['B365H'], errors='coerce').fillna(0.0)
+    df = df[(home_odds > 0) & df['FTR'].isin(['H', 'D', 'A'])]
+    
+    # Football-Data.co.uk uses DD/MM/YYYY, older files DD/MM/YY
+    dates = pd.to_datetime(df['Date'], format='%d/%m/%Y', errors='coerce').combine_first(
+        pd.to_datetime(df['Date'], format='%d/%m/%y', errors='coerce')
+    )
+    
+    matches = pd.DataFrame({
+        'date': dates.dt.strftime('%Y-%m-%d'),
+        'home': df['HomeTeam'],
+        'away': df['AwayTeam'],
+        'home_odds': home_odds[df.index],
+        'result': df['FTR'],
+        'score': df['FTHG'].fillna('') + '-' + df['FTAG'].fillna(''),
+    })
+    return matches.dropna(subset=['date']).reset_index(drop=True)
 
 
 def run_validation():
     """Run strategy on current season."""
     matches = load_matches()
     
-    if not matches:
+    if matches.empty:
         return
     
     print("\n" + "="*70)
     print("🧪 VALIDATING STRATEGY ON 2025/26 SEASON")
     print("="*70)
-    print(f"\nStrategy: HOME WIN @ {STRATEGY['odds_min']}-{STRATEGY['odds_max']} odds")
+    # Strategy parameters are fixed for the run; bind them once
+    odds_min, odds_max = STRATEGY['odds_min'], STRATEGY['odds_max']
+    stake_pct = STRATEGY['stake_pct'] / 100
+    start_bankroll = 1000.0
+    odds_range = f"{odds_min}-{odds_max}"
+    
+    print(f"\nStrategy: HOME WIN @ {odds_range} odds")
     print(f"Total matches in season so far: {len(matches)}")
     
     # Filter qualifying bets
-    qualifying = [m for m in matches 
-                  if STRATEGY['odds_min'] <= m['home_odds'] <= STRATEGY['odds_max']]
+    qualifying = matches[matches['home_odds'].between(odds_min, odds_max)]
     
-    print(f"Qualifying bets (Home @ {STRATEGY['odds_min']}-{STRATEGY['odds_max']}): {len(qualifying)}")
+    print(f"Qualifying bets (Home @ {odds_range}): {len(qualifying)}")
     
-    if not qualifying:
+    if qualifying.empty:
         print("\n⚠️ No qualifying bets found this season yet")
         return
     
-    # Calculate results
-    bankroll = 1000
-    stake_pct = STRATEGY['stake_pct'] / 100
-    
-    wins = 0
-    losses = 0
-    bets = []
+    # Calculate results. Each bet stakes a fixed fraction of the running
+    # bankroll, so the bankroll path is a cumulative product of per-bet
+    # growth factors.
+    odds = qualifying['home_odds'].to_numpy()
+    won = (qualifying['result'] == 'H').to_numpy()
+    
+    growth = np.where(won, 1 + stake_pct * (odds - 1), 1 - stake_pct)
+    bankroll_path = start_bankroll * np.cumprod(growth)
+    stakes = np.concatenate(([start_bankroll], bankroll_path[:-1])) * stake_pct
+    profits = np.where(won, stakes * (odds - 1), -stakes)
+    
+    bankroll = float(bankroll_path[-1])
+    wins = int(won.sum())
+    n_bets = len(qualifying)
+    losses = n_bets - wins
+    
+    # Per-bet columns (SoA); dicts are only built if the bets are saved
+    dates = qualifying['date'].tolist()
+    homes = qualifying['home'].tolist()
+    aways = qualifying['away'].tolist()
+    scores = qualifying['score'].tolist()
+    results = qualifying['result'].tolist()
     
     print("\n" + "-"*70)
     print("BET-BY-BET RESULTS")
     print("-"*70)
     
-    for m in qualifying:
-        stake = bankroll * stake_pct
-        
-        if m['result'] == 'H':
-            profit = stake * (m['home_odds'] - 1)
-            wins += 1
+    # Build every line first and write once, rather than a print per bet
+    lines = []
+    for date, home, away, home_odds, score, result, profit in zip(
+        dates, homes, aways, odds, scores, results, profits
+    ):
+        if result == 'H':
             result_str = f"✅ WON +£{profit:.2f}"
         else:
-            profit = -stake
-            losses += 1
-            result_str = f"❌ LOST -£{stake:.2f}"
+            result_str = f"❌ LOST -£{-profit:.2f}"
         
-        bankroll += profit
-        
-        bets.append({
-            'date': m['date'],
-            'match': f"{m['home']} vs {m['away']}",
-            'odds': m['home_odds'],
-            'score': m['score'],
-            'result': m['result'],
-            'profit': profit,
-            'bankroll': bankroll
-        })
-        
-        print(f"{m['date']} | {m['home']:15} vs {m['away']:15} | "
-              f"H@{m['home_odds']:.2f} | {m['score']} | {result_str}")
+        lines.append(f"{date} | {home:15} vs {away:15} | "
+                     f"H@{home_odds:.2f} | {score} | {result_str}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Summary
-    total_staked = sum(b['profit'] if b['result'] == 'H' else -b['profit'] for b in bets)
-    # Actually calculate total staked properly
-    total_staked = len(bets) * (1000 * stake_pct)  # Approximate
-    total_profit = bankroll - 1000
+    total_staked = n_bets * (start_bankroll * stake_pct)  # Approximate
+    total_profit = bankroll - start_bankroll
     roi = (total_profit / total_staked * 100) if total_staked > 0 else 0
-    win_rate = wins / len(bets) * 100 if bets else 0
-    
-    print("\n" + "="*70)
-    print("SEASON SUMMARY")
-    print("="*70)
-    print(f"\n{'Total bets:':<20} {len(bets)}")
-    print(f"{'Wins:':<20} {wins}")
-    print(f"{'Losses:':<20} {losses}")
-    print(f"{'Win rate:':<20} {win_rate:.1f}%")
-    print(f"{'Starting bankroll:':<20} £1,000.00")
-    print(f"{'Final bankroll:':<20} £{bankroll:,.2f}")
-    print(f"{'Profit:':<20} £{total_profit:+,.2f}")
-    print(f"{'ROI:':<20} {roi:+.1f}%")
+    win_rate = wins / n_bets * 100
+    
+    sys.stdout.write("\n".join([
+        "",
+        "="*70,
+        "SEASON SUMMARY",
+        "="*70,
+        f"\n{'Total bets:':<20} {n_bets}",
+        f"{'Wins:':<20} {wins}",
+        f"{'Losses:':<20} {losses}",
+        f"{'Win rate:':<20} {win_rate:.1f}%",
+        f"{'Starting bankroll:':<20} £1,000.00",
+        f"{'Final bankroll:':<20} £{bankroll:,.2f}",
+        f"{'Profit:':<20} £{total_profit:+,.2f}",
+        f"{'ROI:':<20} {roi:+.1f}%",
+    ]) + "\n")
     
     # Verdict
     print("\n" + "-"*70)
@@ -167,8 +174,8 @@ def run_validation():
             "strategy": {
                 "name": "Home Underdog Edge",
                 "selection": "H",
-                "odds_min": STRATEGY['odds_min'],
-                "odds_max": STRATEGY['odds_max'],
+                "odds_min": odds_min,
+                "odds_max": odds_max,
                 "stake_pct": STRATEGY['stake_pct'],
                 "expected_edge": 5.2
             },
@@ -178,7 +185,7 @@ def run_validation():
             },
             "predictions": [],
             "results_summary": {
-                "total_bets": len(bets),
+                "total_bets": n_bets,
                 "wins": wins,
                 "losses": losses,
                 "pending": 0,
@@ -187,31 +194,34 @@ def run_validation():
             }
         }
         
-        for i, b in enumerate(bets, 1):
+        flat_stake = start_bankroll * stake_pct
+        for i, (date, home, away, home_odds, score, result, profit) in enumerate(zip(
+            dates, homes, aways, odds.tolist(), scores, results, profits.tolist()
+        ), 1):
             data['predictions'].append({
                 "id": i,
-                "created_at": f"{b['date']}T12:00:00",  # Historical
-                "match_date": b['date'],
+                "created_at": f"{date}T12:00:00",  # Historical
+                "match_date": date,
                 "match_time": "15:00",
-                "home_team": b['match'].split(' vs ')[0],
-                "away_team": b['match'].split(' vs ')[1],
+                "home_team": home,
+                "away_team": away,
                 "selection": "H",
-                "odds": b['odds'],
+                "odds": home_odds,
                 "qualifies": True,
-                "stake": round(1000 * stake_pct, 2),
-                "potential_profit": round(1000 * stake_pct * (b['odds'] - 1), 2),
-                "status": "won" if b['result'] == 'H' else "lost",
-                "result": b['result'],
-                "profit_loss": round(b['profit'], 2),
-                "score": b['score'],
-                "settled_at": f"{b['date']}T17:00:00",
+                "stake": round(flat_stake, 2),
+                "potential_profit": round(flat_stake * (home_odds - 1), 2),
+                "status": "won" if result == 'H' else "lost",
+                "result": result,
+                "profit_loss": round(profit, 2),
+                "score": score,
+                "settled_at": f"{date}T17:00:00",
                 "validated": True  # Mark as historical validation
             })
         
-        with open(PREDICTIONS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        print(f"✅ Saved {len(bets)} validated bets to predictions.json")
+        if replace_predictions(data):
+            print(f"✅ Saved {n_bets} validated bets to predictions.json")
+        else:
+            print(f"✅ predictions.json already holds these {n_bets} validated bets")
 
 
 if __name__ == "__main__":
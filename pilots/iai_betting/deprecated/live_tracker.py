@@ -10,8 +10,22 @@ For LIVE betting, you can:
 - Manually enter today's odds
 - Use upcoming fixtures from football-data.co.uk
 - Connect to an odds API (requires setup)
+
+Scripted runs skip the prompts with a JSON batch file:
+    python live_tracker.py --batch inputs.json
+
+    {"bankroll": 1000,
+     "actions": [
+        {"action": "add", "home_team": "Everton", "away_team": "Arsenal",
+         "home_odds": 4.5, "draw_odds": 3.6, "away_odds": 1.8},
+        {"action": "load", "file": "fixtures.csv"},
+        {"action": "show"},
+        {"action": "record", "bet": 1, "won": true},
+        {"action": "performance"}]}
 """
 
+import argparse
+import os
 import sys
 from pathlib import Path
 from dataclasses import dataclass
@@ -21,14 +35,48 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, FloatPrompt, Confirm
+from rich.text import Text
 from rich import box
-import json
+import numpy as np
+import pandas as pd
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent / "live_system"))
+
+from auto_tracker import json_dumps, json_loads
+
+
+def _append_jsonl(path: Path, entry: Dict):
+    """Append one record as a JSON line."""
+    with open(path, 'ab') as f:
+        f.write(json_dumps(entry) + b"\n")
+
 
+def _read_jsonl(path: Path) -> List[Dict]:
+    """Read all records from a JSON-lines file."""
+    if not path.exists():
+        return []
+    with open(path, 'rb') as f:
+        return [json_loads(line) for line in f if line.strip()]
 
-@dataclass
+
+def _migrate_json_log(legacy: Path, path: Path):
+    """Convert a legacy JSON-array log to JSON lines, once.
+    
+    Results recorded in the old format stay inline on each bet, which
+    _load_log() keeps unless bet_results.jsonl has a newer one. The legacy
+    file is left in place.
+    """
+    if path.exists() or not legacy.exists():
+        return
+    log = json_loads(legacy.read_bytes())
+    tmp = path.with_suffix('.jsonl.tmp')
+    tmp.write_bytes(b"".join(json_dumps(entry) + b"\n" for entry in log))
+    os.replace(tmp, path)
+
+
+@dataclass(slots=True)
 class BettingOpportunity:
     """A potential betting opportunity."""
     match: str
@@ -43,7 +91,7 @@ class BettingOpportunity:
     expected_value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyConfig:
     """Strategy configuration."""
     selection: str  # H, D, A
@@ -54,6 +102,24 @@ class StrategyConfig:
     confidence: str
 
 
+# Fixture CSV columns: canonical name -> accepted source columns, in preference order
+FIXTURE_COLUMNS = {
+    "home": ("HomeTeam", "Home"),
+    "away": ("AwayTeam", "Away"),
+    "home_odds": ("B365H", "HomeOdds"),
+    "draw_odds": ("B365D", "DrawOdds"),
+    "away_odds": ("B365A", "AwayOdds"),
+    "kickoff": ("Date", "Kickoff"),
+}
+ODDS_FIELDS = ("home_odds", "draw_odds", "away_odds")
+# Strategy selection -> (odds column, display name); anything else backs the away side
+SELECTION_COLUMNS = {
+    "H": ("home_odds", "Home"),
+    "D": ("draw_odds", "Draw"),
+    "A": ("away_odds", "Away"),
+}
+
+
 # Default optimal strategy (from optimizer)
 DEFAULT_STRATEGY = StrategyConfig(
     selection="H",
@@ -68,13 +134,60 @@ DEFAULT_STRATEGY = StrategyConfig(
 class LiveBettingTracker:
     """Track live betting opportunities."""
     
-    def __init__(self, strategy: StrategyConfig, bankroll: float = 1000.0):
+    def __init__(
+        self,
+        strategy: StrategyConfig,
+        bankroll: float = 1000.0,
+        batch_inputs: Optional[Dict] = None,
+    ):
         self.strategy = strategy
         self.bankroll = bankroll
+        # Strategy thresholds bound once; the config is fixed for a tracker's lifetime
+        self._sel, self._lo, self._hi, self._edge, self._stake_frac = (
+            strategy.selection, strategy.min_odds, strategy.max_odds,
+            strategy.edge, strategy.stake_pct / 100,
+        )
         self.console = Console()
         self.opportunities: List[BettingOpportunity] = []
-        self.bet_log_file = Path(__file__).parent / "bet_log.json"
-        
+        # Append-only logs: bets, and results keyed by the bet's date stamp
+        self.bet_log_file = Path(__file__).parent / "bet_log.jsonl"
+        self.results_file = Path(__file__).parent / "bet_results.jsonl"
+        # Running totals over settled bets, so performance needs no log scan
+        self.stats_file = Path(__file__).parent / "bet_stats.json"
+        # Logs written before the switch to JSON lines
+        _migrate_json_log(Path(__file__).parent / "bet_log.json", self.bet_log_file)
+        # Pre-filled answers for the current batch step (None when interactive).
+        # In batch mode a missing answer takes the prompt's default, and only
+        # a missing required answer falls back to prompting.
+        self._batch_inputs: Optional[Dict] = batch_inputs
+    
+    def set_batch_inputs(self, inputs: Optional[Dict]):
+        """Answers for the next batch step; None switches back to prompting."""
+        self._batch_inputs = inputs
+    
+    def _ask_str(self, key: str, label: str, default: Optional[str] = None) -> str:
+        """Batch value for ``key`` if given, otherwise prompt for it."""
+        if self._batch_inputs is not None:
+            if key in self._batch_inputs:
+                return str(self._batch_inputs[key])
+            if default is not None:
+                return default
+        if default is None:
+            return Prompt.ask(label)
+        return Prompt.ask(label, default=default)
+    
+    def _ask_float(self, key: str, label: str, default: float) -> float:
+        """Batch value for ``key`` if given, otherwise prompt for it."""
+        if self._batch_inputs is not None:
+            return float(self._batch_inputs.get(key, default))
+        return FloatPrompt.ask(label, default=default)
+    
+    def _ask_confirm(self, key: str, label: str) -> bool:
+        """Batch value for ``key`` if given, otherwise ask yes/no."""
+        if self._batch_inputs and key in self._batch_inputs:
+            return bool(self._batch_inputs[key])
+        return Confirm.ask(label)
+    
     def check_match(
         self,
         home_team: str,
@@ -86,11 +199,13 @@ class LiveBettingTracker:
     ) -> Optional[BettingOpportunity]:
         """Check if a match qualifies for betting."""
         
+        edge = self._edge
+        
         # Get the relevant odds based on selection
-        if self.strategy.selection == "H":
+        if self._sel == "H":
             odds = home_odds
             selection_name = "Home"
-        elif self.strategy.selection == "D":
+        elif self._sel == "D":
             odds = draw_odds
             selection_name = "Draw"
         else:
@@ -98,17 +213,17 @@ class LiveBettingTracker:
             selection_name = "Away"
         
         # Check if within odds range
-        if not (self.strategy.min_odds <= odds < self.strategy.max_odds):
+        if not (self._lo <= odds < self._hi):
             return None
         
         # Calculate expected value
         implied_prob = 1 / odds
-        expected_prob = implied_prob + self.strategy.edge
+        expected_prob = implied_prob + edge
         expected_value = (expected_prob * odds) - 1  # EV as decimal
         
         # Calculate recommended stake (Kelly-adjusted)
-        kelly = self.strategy.edge / (odds - 1) if odds > 1 else 0
-        stake = self.bankroll * min(self.strategy.stake_pct / 100, kelly * 0.25)
+        kelly = edge / (odds - 1) if odds > 1 else 0
+        stake = self.bankroll * min(self._stake_frac, kelly * 0.25)
         
         return BettingOpportunity(
             match=f"{home_team} vs {away_team}",
@@ -118,21 +233,73 @@ class LiveBettingTracker:
             selection=selection_name,
             odds=odds,
             implied_prob=implied_prob,
-            historical_edge=self.strategy.edge,
+            historical_edge=edge,
             recommended_stake=stake,
             expected_value=expected_value,
         )
     
+    def check_batch(self, df: pd.DataFrame) -> List[BettingOpportunity]:
+        """Check a whole fixture table at once.
+        
+        Expects the canonical columns produced by ``load_fixtures_from_file``
+        (home, away, home_odds, draw_odds, away_odds, kickoff) and applies the
+        same filter, EV and stake maths as ``check_match`` on NumPy arrays.
+        """
+        sel, lo, hi, edge, stake_frac = self._sel, self._lo, self._hi, self._edge, self._stake_frac
+        odds_col, selection_name = SELECTION_COLUMNS.get(sel, SELECTION_COLUMNS["A"])
+        odds = df[odds_col].to_numpy(dtype=float)
+        mask = (
+            (df["home"].to_numpy() != "")
+            & (df["away"].to_numpy() != "")
+            & (df["home_odds"].to_numpy(dtype=float) > 1)
+            & (odds >= lo)
+            & (odds < hi)
+        )
+        if not mask.any():
+            return []
+        
+        odds_q = odds[mask]
+        implied = 1.0 / odds_q
+        expected_value = (implied + edge) * odds_q - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kelly = np.where(odds_q > 1, edge / (odds_q - 1), 0.0)
+        stakes = self.bankroll * np.minimum(stake_frac, kelly * 0.25)
+        
+        rows = zip(
+            df["home"].to_numpy()[mask],
+            df["away"].to_numpy()[mask],
+            df["kickoff"].to_numpy()[mask],
+            odds_q.tolist(),
+            implied.tolist(),
+            stakes.tolist(),
+            expected_value.tolist(),
+        )
+        return [
+            BettingOpportunity(
+                match=f"{home} vs {away}",
+                home_team=home,
+                away_team=away,
+                kickoff=kickoff,
+                selection=selection_name,
+                odds=o,
+                implied_prob=p,
+                historical_edge=edge,
+                recommended_stake=s,
+                expected_value=ev,
+            )
+            for home, away, kickoff, o, p, s, ev in rows
+        ]
+    
     def add_match_manual(self):
         """Manually add a match to check."""
         self.console.print("\n[bold cyan]➕ Add Match Manually[/bold cyan]\n")
         
-        home_team = Prompt.ask("Home team")
-        away_team = Prompt.ask("Away team")
-        home_odds = FloatPrompt.ask("Home odds", default=2.0)
-        draw_odds = FloatPrompt.ask("Draw odds", default=3.5)
-        away_odds = FloatPrompt.ask("Away odds", default=4.0)
-        kickoff = Prompt.ask("Kickoff time (optional)", default="")
+        home_team = self._ask_str("home_team", "Home team")
+        away_team = self._ask_str("away_team", "Away team")
+        home_odds = self._ask_float("home_odds", "Home odds", default=2.0)
+        draw_odds = self._ask_float("draw_odds", "Draw odds", default=3.5)
+        away_odds = self._ask_float("away_odds", "Away odds", default=4.0)
+        kickoff = self._ask_str("kickoff", "Kickoff time (optional)", default="")
         
         opp = self.check_match(home_team, away_team, home_odds, draw_odds, away_odds, kickoff or None)
         
@@ -141,27 +308,31 @@ class LiveBettingTracker:
             self.console.print(f"\n[green]✅ QUALIFYING BET FOUND![/green]")
             self._show_opportunity(opp)
         else:
-            self.console.print(f"\n[yellow]⚠️ No qualifying bet - odds outside range {self.strategy.min_odds}-{self.strategy.max_odds}[/yellow]")
+            self.console.print(f"\n[yellow]⚠️ No qualifying bet - odds outside range {self._lo}-{self._hi}[/yellow]")
     
     def load_fixtures_from_file(self, filepath: str):
-        """Load fixtures from a CSV file."""
-        import csv
-        
+        """Load fixtures from a CSV file (Football-Data.co.uk or simple column names)."""
         try:
-            with open(filepath, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    home = row.get('HomeTeam', row.get('Home', ''))
-                    away = row.get('AwayTeam', row.get('Away', ''))
-                    home_odds = float(row.get('B365H', row.get('HomeOdds', 0)) or 0)
-                    draw_odds = float(row.get('B365D', row.get('DrawOdds', 0)) or 0)
-                    away_odds = float(row.get('B365A', row.get('AwayOdds', 0)) or 0)
-                    date_str = row.get('Date', row.get('Kickoff', ''))
-                    
-                    if home and away and home_odds > 1:
-                        opp = self.check_match(home, away, home_odds, draw_odds, away_odds, date_str)
-                        if opp:
-                            self.opportunities.append(opp)
+            header = pd.read_csv(filepath, nrows=0).columns
+            source = {
+                canonical: next((c for c in candidates if c in header), None)
+                for canonical, candidates in FIXTURE_COLUMNS.items()
+            }
+            present = {canonical: col for canonical, col in source.items() if col}
+            
+            df = pd.read_csv(
+                filepath,
+                usecols=list(present.values()),
+                dtype={present[k]: 'float64' for k in ODDS_FIELDS if k in present},
+                engine='c',
+            ).rename(columns={col: canonical for canonical, col in present.items()})
+            for canonical in FIXTURE_COLUMNS:
+                if canonical not in df:
+                    df[canonical] = 0.0 if canonical in ODDS_FIELDS else ''
+            df[list(ODDS_FIELDS)] = df[list(ODDS_FIELDS)].fillna(0.0)
+            df[['home', 'away', 'kickoff']] = df[['home', 'away', 'kickoff']].fillna('')
+            
+            self.opportunities.extend(self.check_batch(df))
             
             self.console.print(f"[green]✓ Loaded fixtures from {filepath}[/green]")
             
@@ -200,48 +371,77 @@ Potential profit: £{opp.recommended_stake * (opp.odds - 1):.2f}
         table.add_column("Kickoff")
         table.add_column("Bet", justify="center")
         table.add_column("Odds", justify="right")
-        table.add_column("Edge", justify="right")
+        table.add_column("Edge", justify="right", style="green")
         table.add_column("EV", justify="right")
         table.add_column("Stake", justify="right", style="bold")
         
-        total_stake = 0
-        for opp in self.opportunities:
-            ev_color = "green" if opp.expected_value > 0 else "red"
-            table.add_row(
-                opp.match,
-                opp.kickoff or "-",
-                opp.selection,
-                f"{opp.odds:.2f}",
-                f"[green]+{opp.historical_edge*100:.1f}%[/green]",
-                f"[{ev_color}]{opp.expected_value*100:+.1f}%[/{ev_color}]",
-                f"£{opp.recommended_stake:.2f}",
+        # Text cells carry their style directly, so rich skips markup parsing per cell
+        rows = [
+            (
+                Text(opp.match),
+                Text(opp.kickoff or "-"),
+                Text(opp.selection),
+                Text(f"{opp.odds:.2f}"),
+                Text(f"+{opp.historical_edge*100:.1f}%"),
+                Text(f"{opp.expected_value*100:+.1f}%", style="green" if opp.expected_value > 0 else "red"),
+                Text(f"£{opp.recommended_stake:.2f}"),
             )
-            total_stake += opp.recommended_stake
+            for opp in self.opportunities
+        ]
+        for row in rows:
+            table.add_row(*row)
+        total_stake = sum(opp.recommended_stake for opp in self.opportunities)
         
         self.console.print(table)
         self.console.print(f"\n[bold]Total stake: £{total_stake:.2f}[/bold]")
         self.console.print(f"[dim]Remaining bankroll: £{self.bankroll - total_stake:.2f}[/dim]")
     
+    def _load_log(self) -> List[Dict]:
+        """Read the bet log with recorded results merged in."""
+        log = _read_jsonl(self.bet_log_file)
+        results = {r["date"]: r for r in _read_jsonl(self.results_file)}
+        for b in log:
+            r = results.get(b["date"])
+            if r is not None:
+                b["result"] = r["result"]
+                b["profit"] = r["profit"]
+        return log
+    
+    def _load_stats(self) -> Dict:
+        """Read the running totals, rebuilding them from the logs if absent."""
+        if self.stats_file.exists():
+            return json_loads(self.stats_file.read_bytes())
+        
+        stats = {"total_bets": 0, "wins": 0, "total_stake": 0.0, "total_profit": 0.0}
+        for b in self._load_log():
+            if b.get("result") is not None:
+                stats["total_bets"] += 1
+                stats["wins"] += b["result"] == "won"
+                stats["total_stake"] += b["stake"]
+                stats["total_profit"] += b.get("profit", 0)
+        return stats
+    
+    def _update_stats(self, profit: float, stake: float, won: bool):
+        """Fold one settled bet into the running totals."""
+        stats = self._load_stats()
+        stats["total_bets"] += 1
+        stats["wins"] += won
+        stats["total_stake"] += stake
+        stats["total_profit"] += profit
+        self.stats_file.write_bytes(json_dumps(stats))
+    
     def log_bet(self, opp: BettingOpportunity, placed: bool = True):
         """Log a bet for tracking."""
-        log = []
-        if self.bet_log_file.exists():
-            with open(self.bet_log_file, 'r') as f:
-                log = json.load(f)
-        
-        log.append({
+        _append_jsonl(self.bet_log_file, {
             "date": datetime.now().isoformat(),
             "match": opp.match,
             "selection": opp.selection,
             "odds": opp.odds,
             "stake": opp.recommended_stake,
             "placed": placed,
-            "result": None,  # To be updated later
+            "result": None,  # Set from bet_results.jsonl once recorded
         })
         
-        with open(self.bet_log_file, 'w') as f:
-            json.dump(log, f, indent=2)
-        
         self.console.print(f"[green]✓ Bet logged to {self.bet_log_file}[/green]")
     
     def record_result(self):
@@ -250,9 +450,7 @@ Potential profit: £{opp.recommended_stake * (opp.odds - 1):.2f}
             self.console.print("[yellow]No bet log found.[/yellow]")
             return
         
-        with open(self.bet_log_file, 'r') as f:
-            log = json.load(f)
-        
+        log = self._load_log()
         pending = [b for b in log if b.get("result") is None]
         
         if not pending:
@@ -264,18 +462,20 @@ Potential profit: £{opp.recommended_stake * (opp.odds - 1):.2f}
         for i, bet in enumerate(pending):
             self.console.print(f"{i+1}. {bet['match']} - {bet['selection']} @ {bet['odds']:.2f}")
         
-        idx = int(Prompt.ask("Select bet #", default="1")) - 1
+        idx = int(self._ask_str("bet", "Select bet #", default="1")) - 1
         if 0 <= idx < len(pending):
-            won = Confirm.ask("Did the bet win?")
-            
-            # Find and update in log
-            for b in log:
-                if b["date"] == pending[idx]["date"]:
-                    b["result"] = "won" if won else "lost"
-                    b["profit"] = b["stake"] * (b["odds"] - 1) if won else -b["stake"]
+            won = self._ask_confirm("won", "Did the bet win?")
             
-            with open(self.bet_log_file, 'w') as f:
-                json.dump(log, f, indent=2)
+            bet = pending[idx]
+            profit = bet["stake"] * (bet["odds"] - 1) if won else -bet["stake"]
+            # Totals first: if missing they are rebuilt from the logs, which
+            # must not yet include this result
+            self._update_stats(profit, bet["stake"], won)
+            _append_jsonl(self.results_file, {
+                "date": bet["date"],
+                "result": "won" if won else "lost",
+                "profit": profit,
+            })
             
             self.console.print(f"[green]✓ Result recorded[/green]")
     
@@ -285,23 +485,21 @@ Potential profit: £{opp.recommended_stake * (opp.odds - 1):.2f}
             self.console.print("[yellow]No bet log found.[/yellow]")
             return
         
-        with open(self.bet_log_file, 'r') as f:
-            log = json.load(f)
+        stats = self._load_stats()
+        n_completed = stats["total_bets"]
         
-        completed = [b for b in log if b.get("result") is not None]
-        
-        if not completed:
+        if not n_completed:
             self.console.print("[yellow]No completed bets to analyze.[/yellow]")
             return
         
-        wins = sum(1 for b in completed if b["result"] == "won")
-        total_stake = sum(b["stake"] for b in completed)
-        total_profit = sum(b.get("profit", 0) for b in completed)
+        wins = stats["wins"]
+        total_stake = stats["total_stake"]
+        total_profit = stats["total_profit"]
         
         self.console.print("\n[bold cyan]📊 BETTING PERFORMANCE[/bold cyan]\n")
         
-        self.console.print(f"Total bets: {len(completed)}")
-        self.console.print(f"Wins: {wins} ({wins/len(completed)*100:.1f}%)")
+        self.console.print(f"Total bets: {n_completed}")
+        self.console.print(f"Wins: {wins} ({wins/n_completed*100:.1f}%)")
         self.console.print(f"Total staked: £{total_stake:.2f}")
         
         profit_color = "green" if total_profit > 0 else "red"
@@ -309,7 +507,40 @@ Potential profit: £{opp.recommended_stake * (opp.odds - 1):.2f}
         self.console.print(f"ROI: [{profit_color}]{total_profit/total_stake*100:+.1f}%[/{profit_color}]")
 
 
+def run_batch(batch_file: str):
+    """Run a scripted sequence of tracker actions from a JSON file, without prompts."""
+    batch = json_loads(Path(batch_file).read_bytes())
+    tracker = LiveBettingTracker(
+        DEFAULT_STRATEGY, float(batch.get("bankroll", 1000.0)), batch_inputs={}
+    )
+    
+    for step in batch.get("actions", []):
+        action = step.get("action")
+        tracker.set_batch_inputs(step)
+        if action == "add":
+            tracker.add_match_manual()
+        elif action == "load":
+            tracker.load_fixtures_from_file(step["file"])
+        elif action == "show":
+            tracker.show_all_opportunities()
+        elif action == "record":
+            tracker.record_result()
+        elif action == "performance":
+            tracker.show_performance()
+        else:
+            tracker.console.print(f"[red]Unknown batch action: {action!r}[/red]")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Live betting tracker")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="run the actions in a JSON batch file instead of the interactive menu")
+    args = parser.parse_args()
+    
+    if args.batch:
+        run_batch(args.batch)
+        return
+    
     console = Console()
     
     console.print()
@@ -8,16 +8,15 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 from iai_core.orchestrator import BaseOrchestrator
-from iai_core.authority import FoundryLocalAuthority
 from iai_core.types import Invariants, GenerationResult, Proposal, AuthorityDecision, Verdict
 
-from .simulator import BettingSimulator, SimulationConfig
-from .strategies import IAIStrategy
-from .challenger import BettingChallenger
-from .evaluator import BettingEvaluator
+# The Authority (LLM SDK), simulator and strategy stack are imported in
+# BettingOrchestrator.__init__, so importing this module stays cheap
+if TYPE_CHECKING:
+    from .simulator import BettingSimulator
 
 
 class BettingOrchestrator(BaseOrchestrator):
@@ -31,9 +30,16 @@ class BettingOrchestrator(BaseOrchestrator):
     4. Update strategy parameters
     """
     
+    # Parameter change actions: (current value, change spec) -> new value
+    _ACTIONS = {
+        "multiply": lambda current, change: current * change.get("factor", 1.0),
+        "add": lambda current, change: current + change.get("value", 0),
+        "set": lambda current, change: change.get("value", current),
+    }
+    
     def __init__(
         self,
-        simulator: Optional[BettingSimulator] = None,
+        simulator: Optional["BettingSimulator"] = None,
         model_alias: str = "phi-3.5-mini",
         strictness: str = "balanced",
         output_dir: str = "runs/betting_evolution",
@@ -47,6 +53,12 @@ class BettingOrchestrator(BaseOrchestrator):
             strictness: Authority strictness level
             output_dir: Output directory for runs
         """
+        from iai_core.authority import FoundryLocalAuthority
+        from .simulator import BettingSimulator
+        from .strategies import IAIStrategy
+        from .challenger import BettingChallenger
+        from .evaluator import BettingEvaluator
+        
         # Create simulator if needed
         self.simulator = simulator or BettingSimulator()
         
@@ -166,14 +178,10 @@ When reviewing proposals:
             
             for param, change in param_changes.items():
                 if param in current_params:
-                    action = change.get("action", "set")
-                    
-                    if action == "multiply":
-                        new_params[param] = current_params[param] * change.get("factor", 1.0)
-                    elif action == "add":
-                        new_params[param] = current_params[param] + change.get("value", 0)
-                    elif action == "set":
-                        new_params[param] = change.get("value", current_params[param])
+                    # Unknown actions leave the parameter unchanged
+                    apply = self._ACTIONS.get(change.get("action", "set"))
+                    if apply is not None:
+                        new_params[param] = apply(current_params[param], change)
             
             if new_params:
                 self.iai_strategy.update_params(new_params)
@@ -184,10 +192,12 @@ When reviewing proposals:
         if proposal.proposed_metrics:
             primary = proposal.proposed_metrics[0]
             if primary.name != self.current_invariants.primary_metric:
+                # Only the primary metric changes. Invariants are never mutated
+                # in place, so the thresholds/constraints dicts can be shared
                 new_invariants = Invariants(
                     primary_metric=primary.name,
-                    thresholds=self.current_invariants.thresholds.copy(),
-                    constraints=self.current_invariants.constraints.copy(),
+                    thresholds=self.current_invariants.thresholds,
+                    constraints=self.current_invariants.constraints,
                     metadata={"changed_at_generation": decision.timestamp},
                 )
         
@@ -10,20 +10,19 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from pilots.iai_betting.simulator import BettingSimulator, SimulationConfig
-from pilots.iai_betting.strategies import (
-    FlatBettingStrategy,
-    KellyStrategy,
-    FractionalKellyStrategy,
-    IAIStrategy,
-    SelectiveEdgeStrategy,
-    UnderdogValueStrategy,
-    train_edge_model,
-)
-
 
 def run_quick_test():
     """Run a quick test of the betting system."""
+    # Imported here so the --mode full path only loads what it uses
+    from pilots.iai_betting.simulator import BettingSimulator, SimulationConfig
+    from pilots.iai_betting.strategies import (
+        FlatBettingStrategy,
+        FractionalKellyStrategy,
+        IAIStrategy,
+        SelectiveEdgeStrategy,
+        UnderdogValueStrategy,
+        train_edge_model,
+    )
     
     print("="*70)
     print("IAI BETTING PILOT - QUICK TEST")
@@ -10,15 +10,20 @@ Or with custom bankroll:
     python todays_bets.py --bankroll 500
 """
 
+import os
 import sys
+import pickle
 import argparse
 from pathlib import Path
-from datetime import datetime, date
+from datetime import date
 from dataclasses import dataclass
-from typing import List, Optional
-import urllib.request
+from functools import lru_cache
+from typing import Iterator, List
 import csv
 import io
+from bisect import bisect_right
+
+import numpy as np
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -38,14 +43,33 @@ class TodaysBet:
     confidence: str
 
 
+@dataclass(frozen=True, slots=True)
+class Strategy:
+    """Betting strategy parameters."""
+    selection: str  # H, D, A
+    min_odds: float
+    max_odds: float
+    edge: float
+    stake_pct: float
+
+
 # The strategy from optimizer
-STRATEGY = {
-    "selection": "H",  # Home win
-    "min_odds": 4.0,
-    "max_odds": 6.0,
-    "edge": 0.052,  # 5.2% historical edge
-    "stake_pct": 3.0,
-}
+STRATEGY = Strategy(
+    selection="H",  # Home win
+    min_odds=4.0,
+    max_odds=6.0,
+    edge=0.052,  # 5.2% historical edge
+    stake_pct=3.0,
+)
+STAKE_FRAC = STRATEGY.stake_pct / 100
+
+
+# Confidence by odds bucket: HIGH in the 4.5-5.5 sweet spot (inclusive),
+# MEDIUM elsewhere in 4.0-6.0, LOW outside. Bucket i covers
+# [_CONF_EDGES[i-1], _CONF_EDGES[i]); the third edge sits one ulp above 5.5
+# so that 5.5 itself is HIGH.
+_CONF_EDGES = (4.0, 4.5, float(np.nextafter(5.5, np.inf)), 6.0)
+_CONF_TABLE = ("LOW", "MEDIUM", "HIGH", "MEDIUM", "LOW")
 
 
 def get_current_fixtures() -> List[dict]:
@@ -57,53 +81,93 @@ def get_current_fixtures() -> List[dict]:
     - A fixtures API (football-data.org)
     
     For now, returns sample data or prompts manual entry.
+    
+    Rows are normalised to {'home', 'away', 'league', 'odds'} whichever
+    column names the CSV uses (home/HomeTeam, home_odds/B365H, ...).
     """
     # Try to load from a local file first
     fixtures_file = Path(__file__).parent / "upcoming_fixtures.csv"
     
     if fixtures_file.exists():
-        fixtures = []
-        with open(fixtures_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                fixtures.append(row)
-        return fixtures
+        st = fixtures_file.stat()
+        return _load_fixtures(str(fixtures_file), st.st_mtime_ns, st.st_size)
     
     return []
 
 
-def find_qualifying_bets(fixtures: List[dict], bankroll: float) -> List[TodaysBet]:
-    """Find bets that match our strategy."""
-    bets = []
+# Bump when the normalised fixture layout changes, to invalidate old sidecars
+FIXTURE_SCHEMA = 1
+
+
+def _normalise_fixture(row: dict) -> dict:
+    """Map a raw CSV row onto the fixture keys used by find_qualifying_bets."""
+    return {
+        'home': row.get('home') or row.get('HomeTeam') or 'Unknown',
+        'away': row.get('away') or row.get('AwayTeam') or 'Unknown',
+        'league': row.get('league') or 'Premier League',
+        'odds': float(row.get('home_odds') or row.get('B365H') or 0),
+    }
+
+
+@lru_cache(maxsize=4)
+def _load_fixtures(path: str, mtime_ns: int, size: int) -> List[dict]:
+    """Parse a fixtures CSV, via a pickle sidecar keyed on the CSV's mtime and size.
     
-    for f in fixtures:
-        home_odds = float(f.get('home_odds', f.get('B365H', 0)) or 0)
-        
-        if STRATEGY["min_odds"] <= home_odds < STRATEGY["max_odds"]:
-            stake = bankroll * (STRATEGY["stake_pct"] / 100)
-            potential_profit = stake * (home_odds - 1)
-            
-            # Determine confidence based on odds
-            if 4.5 <= home_odds <= 5.5:
-                confidence = "HIGH"  # Sweet spot
-            elif 4.0 <= home_odds < 4.5 or 5.5 < home_odds < 6.0:
-                confidence = "MEDIUM"
-            else:
-                confidence = "LOW"
-            
-            bets.append(TodaysBet(
-                home_team=f.get('home', f.get('HomeTeam', 'Unknown')),
-                away_team=f.get('away', f.get('AwayTeam', 'Unknown')),
-                league=f.get('league', 'Premier League'),
-                selection="HOME WIN",
-                odds=home_odds,
-                stake=stake,
-                potential_profit=potential_profit,
-                edge=STRATEGY["edge"],
-                confidence=confidence,
-            ))
+    The sidecar (<csv>.pkl) is reused until the CSV changes, so warm runs
+    skip CSV parsing; the lru_cache covers repeat calls within one process.
+    """
+    cache_file = Path(path + ".pkl")
+    key = (FIXTURE_SCHEMA, mtime_ns, size)
     
-    return bets
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_key, fixtures = pickle.load(f)
+            if cached_key == key:
+                return fixtures
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass  # Unreadable sidecar: rebuild it below
+    
+    with open(path, 'r') as f:
+        fixtures = [_normalise_fixture(row) for row in csv.DictReader(f)]
+    
+    # Write-then-rename so a concurrent reader never sees a partial pickle
+    tmp = cache_file.with_suffix(".pkl.tmp")
+    with open(tmp, 'wb') as f:
+        pickle.dump((key, fixtures), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_file)
+    return fixtures
+
+
+def find_qualifying_bets(fixtures: List[dict], bankroll: float) -> Iterator[TodaysBet]:
+    """Yield bets that match our strategy (fixtures as from get_current_fixtures)."""
+    # Filter, stake and confidence are computed over all fixtures at once;
+    # TodaysBet objects are only built for the qualifying rows
+    odds = np.fromiter((f['odds'] for f in fixtures), dtype=np.float64, count=len(fixtures))
+    mask = (odds >= STRATEGY.min_odds) & (odds < STRATEGY.max_odds)
+    
+    stake = bankroll * STAKE_FRAC
+    odds_q = odds[mask]
+    profits = stake * (odds_q - 1)
+    
+    # Determine confidence based on odds
+    confidences = np.array(_CONF_TABLE)[np.digitize(odds_q, _CONF_EDGES)]
+    
+    qualifying = (f for f, keep in zip(fixtures, mask.tolist()) if keep)
+    for f, home_odds, potential_profit, confidence in zip(
+        qualifying, odds_q.tolist(), profits.tolist(), confidences.tolist()
+    ):
+        yield TodaysBet(
+            home_team=f['home'],
+            away_team=f['away'],
+            league=f['league'],
+            selection="HOME WIN",
+            odds=home_odds,
+            stake=stake,
+            potential_profit=potential_profit,
+            edge=STRATEGY.edge,
+            confidence=confidence,
+        )
 
 
 def manual_entry(bankroll: float) -> List[TodaysBet]:
@@ -111,10 +175,13 @@ def manual_entry(bankroll: float) -> List[TodaysBet]:
     print("\n" + "="*60)
     print("ENTER TODAY'S FIXTURES")
     print("="*60)
-    print(f"\nLooking for: HOME teams with odds {STRATEGY['min_odds']} - {STRATEGY['max_odds']}")
+    print(f"\nLooking for: HOME teams with odds {STRATEGY.min_odds} - {STRATEGY.max_odds}")
     print("Enter 'done' when finished.\n")
     
     bets = []
+    # Constant for the whole session
+    min_odds, max_odds, edge = STRATEGY.min_odds, STRATEGY.max_odds, STRATEGY.edge
+    stake = bankroll * STAKE_FRAC
     
     while True:
         home = input("Home team (or 'done'): ").strip()
@@ -129,13 +196,8 @@ def manual_entry(bankroll: float) -> List[TodaysBet]:
             print("Invalid odds, skipping...")
             continue
         
-        if STRATEGY["min_odds"] <= home_odds < STRATEGY["max_odds"]:
-            stake = bankroll * (STRATEGY["stake_pct"] / 100)
-            
-            if 4.5 <= home_odds <= 5.5:
-                confidence = "HIGH"
-            else:
-                confidence = "MEDIUM"
+        if min_odds <= home_odds < max_odds:
+            confidence = _CONF_TABLE[bisect_right(_CONF_EDGES, home_odds)]
             
             bet = TodaysBet(
                 home_team=home,
@@ -145,13 +207,13 @@ def manual_entry(bankroll: float) -> List[TodaysBet]:
                 odds=home_odds,
                 stake=stake,
                 potential_profit=stake * (home_odds - 1),
-                edge=STRATEGY["edge"],
+                edge=edge,
                 confidence=confidence,
             )
             bets.append(bet)
             print(f"  ✅ QUALIFIES! Bet £{stake:.2f} on {home}")
         else:
-            print(f"  ❌ Doesn't qualify (odds {home_odds} not in {STRATEGY['min_odds']}-{STRATEGY['max_odds']})")
+            print(f"  ❌ Doesn't qualify (odds {home_odds} not in {min_odds}-{max_odds})")
         
         print()
     
@@ -160,58 +222,70 @@ def manual_entry(bankroll: float) -> List[TodaysBet]:
 
 def display_bets(bets: List[TodaysBet], bankroll: float):
     """Display the betting recommendations."""
-    print("\n")
-    print("╔" + "═"*58 + "╗")
-    print("║" + " "*18 + "⚽ TODAY'S BETS ⚽" + " "*19 + "║")
-    print("╚" + "═"*58 + "╝")
-    print()
+    # Output is buffered and written to stdout once, not print()ed line by line
+    buf = io.StringIO()
+    
+    def emit(text=""):
+        buf.write(text)
+        buf.write("\n")
+    
+    emit("\n")
+    emit("╔" + "═"*58 + "╗")
+    emit("║" + " "*18 + "⚽ TODAY'S BETS ⚽" + " "*19 + "║")
+    emit("╚" + "═"*58 + "╝")
+    emit()
     
     if not bets:
-        print("❌ NO QUALIFYING BETS TODAY")
-        print()
-        print("Strategy requires: Home team odds between 4.0 and 6.0")
-        print("Check again when underdogs are playing at home.")
+        emit("❌ NO QUALIFYING BETS TODAY")
+        emit()
+        emit("Strategy requires: Home team odds between 4.0 and 6.0")
+        emit("Check again when underdogs are playing at home.")
+        sys.stdout.write(buf.getvalue())
         return
     
-    print(f"📅 Date: {date.today().strftime('%A, %d %B %Y')}")
-    print(f"💰 Bankroll: £{bankroll:,.0f}")
-    print(f"📊 Strategy: Home Win @ 4.0-6.0 odds (+5.2% edge)")
-    print()
-    print("─"*60)
+    emit(f"📅 Date: {date.today().strftime('%A, %d %B %Y')}")
+    emit(f"💰 Bankroll: £{bankroll:,.0f}")
+    emit(f"📊 Strategy: Home Win @ 4.0-6.0 odds (+5.2% edge)")
+    emit()
+    emit("─"*60)
     
+    # One pass over the bets: detail blocks print as we go, while the
+    # stake total and the summary-box lines are collected for the end
     total_stake = 0
+    summary_lines = []
     
     for i, bet in enumerate(bets, 1):
         conf_emoji = "🟢" if bet.confidence == "HIGH" else "🟡"
         
-        print(f"\n  BET #{i}: {conf_emoji} {bet.confidence} CONFIDENCE")
-        print(f"  ├─ Match: {bet.home_team} vs {bet.away_team}")
-        print(f"  ├─ Selection: {bet.selection}")
-        print(f"  ├─ Odds: {bet.odds:.2f}")
-        print(f"  ├─ Stake: £{bet.stake:.2f}")
-        print(f"  └─ Potential Profit: £{bet.potential_profit:.2f}")
+        emit(f"\n  BET #{i}: {conf_emoji} {bet.confidence} CONFIDENCE")
+        emit(f"  ├─ Match: {bet.home_team} vs {bet.away_team}")
+        emit(f"  ├─ Selection: {bet.selection}")
+        emit(f"  ├─ Odds: {bet.odds:.2f}")
+        emit(f"  ├─ Stake: £{bet.stake:.2f}")
+        emit(f"  └─ Potential Profit: £{bet.potential_profit:.2f}")
         
         total_stake += bet.stake
+        line = f"  £{bet.stake:.0f} on {bet.home_team} to WIN @ {bet.odds:.2f}"
+        summary_lines.append(f"│{line:<58}│")
     
-    print()
-    print("─"*60)
-    print(f"\n  TOTAL STAKE: £{total_stake:.2f}")
-    print(f"  REMAINING:   £{bankroll - total_stake:.2f}")
-    print()
+    emit()
+    emit("─"*60)
+    emit(f"\n  TOTAL STAKE: £{total_stake:.2f}")
+    emit(f"  REMAINING:   £{bankroll - total_stake:.2f}")
+    emit()
     
     # Summary box
-    print("╭" + "─"*58 + "╮")
-    print("│" + " "*20 + "PLACE THESE BETS:" + " "*19 + "│")
-    print("├" + "─"*58 + "┤")
-    for bet in bets:
-        line = f"  £{bet.stake:.0f} on {bet.home_team} to WIN @ {bet.odds:.2f}"
-        print(f"│{line:<58}│")
-    print("╰" + "─"*58 + "╯")
-    print()
+    emit("╭" + "─"*58 + "╮")
+    emit("│" + " "*20 + "PLACE THESE BETS:" + " "*19 + "│")
+    emit("├" + "─"*58 + "┤")
+    emit("\n".join(summary_lines))
+    emit("╰" + "─"*58 + "╯")
+    emit()
     
     # Disclaimer
-    print("[Remember: Only bet what you can afford to lose]")
-    print("[Historical edge: +5.2% over 9 seasons, but no guarantees]")
+    emit("[Remember: Only bet what you can afford to lose]")
+    emit("[Historical edge: +5.2% over 9 seasons, but no guarantees]")
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
@@ -234,7 +308,7 @@ def main():
         
         if fixtures:
             print(f"\n✓ Loaded {len(fixtures)} fixtures from file")
-            bets = find_qualifying_bets(fixtures, bankroll)
+            bets = list(find_qualifying_bets(fixtures, bankroll))
         else:
             print("\nNo fixtures file found.")
             print("Options:")
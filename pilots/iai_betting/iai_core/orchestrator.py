@@ -60,14 +60,16 @@ class IAIOrchestrator:
         results = []
         decisions = []
         
+        # Challenger proposes
         for hypothesis in to_evaluate:
-            # Challenger proposes
             hypothesis.status = "EVALUATING"
-            
-            # Evaluator tests
-            evaluation = self.evaluator.evaluate(hypothesis, matches_df, initial_bankroll)
+        
+        # Evaluator tests (one pass over the match data for all hypotheses)
+        evaluations = self.evaluator.evaluate_many(to_evaluate, matches_df, initial_bankroll)
+        
+        for hypothesis, evaluation in zip(to_evaluate, evaluations):
             self.evaluation_results.append(evaluation)
-            hypothesis.evaluation_result = evaluation.__dict__
+            hypothesis.evaluation_result = evaluation.to_dict()
             
             # Authority reviews
             decision = self.authority.review(hypothesis, evaluation)
@@ -95,6 +97,20 @@ class IAIOrchestrator:
             }
         }
     
+    def results_as_frame(self) -> pd.DataFrame:
+        """
+        All evaluation results so far as a DataFrame, one row per evaluation.
+        
+        Holds the scalar metrics only (season_edges is summarised by edge_std),
+        for columnar analysis across hypotheses and cycles.
+        """
+        rows = []
+        for evaluation in self.evaluation_results:
+            row = evaluation.to_dict()
+            del row["season_edges"]
+            rows.append(row)
+        return pd.DataFrame(rows)
+    
     def get_deployment_ready_hypotheses(self) -> List[BettingHypothesis]:
         """Get hypotheses that Authority has accepted for deployment."""
         return self.challenger.get_accepted_hypotheses()
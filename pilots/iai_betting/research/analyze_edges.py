@@ -6,47 +6,53 @@ This helps answer: Are the edges we found real, or just noise?
 import sys
 from pathlib import Path
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add the iai_betting directory to path for imports
+iai_betting_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(iai_betting_dir))
 
-from pilots.iai_betting.data import FootballDataLoader, Match
+import numpy as np
+
+from core.data import FootballDataLoader, Match
 from typing import List, Dict, Tuple
 
 
+def match_arrays(matches: List[Match]) -> Dict[str, np.ndarray]:
+    """Odds per selection ("H"/"D"/"A") and results of a season, as arrays."""
+    return {
+        "H": np.array([m.odds.home_odds for m in matches], dtype=float),
+        "D": np.array([m.odds.draw_odds for m in matches], dtype=float),
+        "A": np.array([m.odds.away_odds for m in matches], dtype=float),
+        "result": np.array([m.result for m in matches]),
+    }
+
+
 def analyze_odds_range(
-    matches: List[Match], 
+    arrays: Dict[str, np.ndarray], 
     selection: str, 
     min_odds: float, 
     max_odds: float
 ) -> Dict:
-    """Analyze a specific selection/odds range."""
+    """Analyze a specific selection/odds range (arrays from match_arrays)."""
     
-    filtered = []
-    for m in matches:
-        if selection == "H":
-            odds = m.odds.home_odds
-        elif selection == "D":
-            odds = m.odds.draw_odds
-        else:
-            odds = m.odds.away_odds
-        
-        if min_odds <= odds < max_odds:
-            filtered.append((m, odds, m.result == selection))
+    odds = arrays[selection]
+    mask = (odds >= min_odds) & (odds < max_odds)
+    n = int(mask.sum())
     
-    if not filtered:
+    if n == 0:
         return {"n": 0}
     
-    wins = sum(1 for _, _, won in filtered if won)
-    implied = sum(1/odds for _, odds, _ in filtered) / len(filtered)
-    actual = wins / len(filtered)
+    sel_odds = odds[mask]
+    wins = int((arrays["result"][mask] == selection).sum())
+    implied = (1 / sel_odds).mean()
+    actual = wins / n
     
     return {
-        "n": len(filtered),
+        "n": n,
         "wins": wins,
         "actual_rate": actual,
         "implied_rate": implied,
         "edge": actual - implied,
-        "roi": (actual * (sum(odds for _, odds, _ in filtered) / len(filtered)) - 1),
+        "roi": (actual * sel_odds.mean() - 1),
     }
 
 
@@ -65,7 +71,7 @@ def main():
         try:
             matches = loader.load_season("E0", season)
             if matches:
-                all_matches[season] = matches
+                all_matches[season] = match_arrays(matches)
                 print(f"Loaded {len(matches)} matches from {season}")
         except Exception as e:
             print(f"Failed to load {season}: {e}")
@@ -90,9 +96,11 @@ def main():
         total_n = 0
         total_wins = 0
         total_implied = 0
+        season_stats = {}
         
-        for season, matches in sorted(all_matches.items()):
-            stats = analyze_odds_range(matches, selection, min_odds, max_odds)
+        for season, arrays in sorted(all_matches.items()):
+            stats = analyze_odds_range(arrays, selection, min_odds, max_odds)
+            season_stats[season] = stats
             
             if stats["n"] > 0:
                 edge_str = f"{stats['edge']*100:+.1f}%"
@@ -116,8 +124,8 @@ def main():
                   f"{overall_implied*100:>7.1f}% {overall_edge*100:+.1f}%          {edge_marker}")
             
             # Count positive edge seasons
-            positive_seasons = sum(1 for s, m in all_matches.items() 
-                                   if analyze_odds_range(m, selection, min_odds, max_odds).get("edge", 0) > 0)
+            positive_seasons = sum(1 for stats in season_stats.values()
+                                   if stats.get("edge", 0) > 0)
             print(f"Positive edge in {positive_seasons}/{len(all_matches)} seasons")
 
 
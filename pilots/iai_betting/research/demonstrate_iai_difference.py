@@ -5,7 +5,9 @@ Shows how IAI is NOT just "pick one strategy and stop" -
 it's a CONTINUOUS learning system that can adapt.
 """
 
+import io
 import sys
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 
@@ -16,110 +18,97 @@ from iai_core.hypotheses import BettingHypothesis, ALL_HYPOTHESES
 from research.validate_iai import load_historical_data
 
 
-def simulate_market_shift():
-    """
-    Simulate what happens if market conditions change.
-    
-    IAI would detect this and switch strategies automatically.
-    Production system would keep using the old strategy and lose money.
-    """
-    print("="*80)
-    print("SCENARIO: Market Conditions Change")
-    print("="*80)
-    
-    print("\nImagine bookmakers adjust their odds after 2 years...")
-    print("They notice home underdogs @ 4-6 odds are being exploited")
-    print("So they reduce those odds slightly, making that strategy unprofitable")
-    print("\nWhat happens?")
-    
-    print("\n" + "-"*80)
-    print("CURRENT PRODUCTION SYSTEM (No IAI):")
-    print("-"*80)
-    print("✗ Keeps betting Home @ 4-6 odds")
-    print("✗ Doesn't detect edge has disappeared")
-    print("✗ Loses money for months before you manually notice")
-    print("✗ You have to manually research alternatives")
-    print("✗ You have to manually code new strategy")
-    print("✗ You have to manually deploy")
-    
-    print("\n" + "-"*80)
-    print("IAI SYSTEM (Continuous Learning):")
-    print("-"*80)
-    print("✓ Re-evaluates all 8 hypotheses weekly")
-    print("✓ Detects H1 edge dropped below 2%")
-    print("✓ Authority REJECTS H1 automatically")
-    print("✓ Evaluator finds H3 (Home Extreme 6-10) now has 4% edge")
-    print("✓ Authority ACCEPTS H3")
-    print("✓ System switches to H3 automatically")
-    print("✓ Continues making money with new strategy")
-    print("\nNo manual intervention needed!")
+# The demo text is static, so each section is built once here and written
+# to stdout in a single call rather than line by line.
+_RULE = "=" * 80
+_DIVIDER = "-" * 80
 
+_TITLE_BANNER = f"""\
+{_RULE}
+IAI IS NOT 'PICK ONE STRATEGY AND STOP'
+It's a Continuous Learning Intelligence System
+{_RULE}
+"""
 
-def demonstrate_multi_strategy():
-    """Show that IAI can run multiple strategies simultaneously."""
-    print("\n" + "="*80)
-    print("IAI CAPABILITY: Multi-Strategy Portfolio")
-    print("="*80)
-    
-    print("\nIAI doesn't have to pick ONE strategy - it can run MULTIPLE!")
-    
-    print("\nExample portfolio:")
-    print("  • 60% bankroll → H1 (Home 4-6 odds) - Edge 3.3%")
-    print("  • 30% bankroll → H3 (Home 6-10 odds) - Edge 2.5%")
-    print("  • 10% bankroll → H7 (Away 6-10 odds) - Edge 1.0%")
-    
-    print("\nBenefits:")
-    print("  ✓ Diversification - reduces variance")
-    print("  ✓ More betting opportunities")
-    print("  ✓ Exploits multiple market inefficiencies")
-    print("  ✓ Authority continuously rebalances based on performance")
+_MARKET_SHIFT_BANNER = f"""\
+{_RULE}
+SCENARIO: Market Conditions Change
+{_RULE}
 
+Imagine bookmakers adjust their odds after 2 years...
+They notice home underdogs @ 4-6 odds are being exploited
+So they reduce those odds slightly, making that strategy unprofitable
 
-def demonstrate_hypothesis_generation():
-    """Show how to dynamically generate new hypotheses."""
-    print("\n" + "="*80)
-    print("IAI CAPABILITY: Dynamic Hypothesis Generation")
-    print("="*80)
-    
-    print("\nIAI can GENERATE new hypotheses based on patterns:")
-    
-    # Example: Generate hypotheses for different leagues
-    leagues = ["E0", "E1", "E2", "D1", "D2", "F1", "I1", "SP1"]
-    
-    print("\nExample: League-specific strategies")
-    new_hypotheses = []
-    for league in leagues[:3]:  # Show first 3
-        h = BettingHypothesis(
-            id=f"H_LEAGUE_{league}",
-            name=f"Home Underdogs in {league}",
-            description=f"Home 4-6 odds specifically in {league}",
-            selection="H",
-            odds_min=4.0,
-            odds_max=6.0,
-            stake_pct=3.0,
-            expected_edge=0.0,  # Unknown - to be discovered
-            expected_win_rate=0.0,
-            status="PROPOSED"
-        )
-        new_hypotheses.append(h)
-        print(f"  ✓ {h.id}: {h.name}")
-    
-    print("\nIAI can also generate hypotheses for:")
-    print("  • Time-based patterns (day of week, month, season)")
-    print("  • Team-specific patterns (form, home/away record)")
-    print("  • Odds movements (line shopping, steam moves)")
-    print("  • Combination strategies (home underdog + total goals)")
-    
-    print("\nThe system tests EVERYTHING and keeps what works!")
+What happens?
 
+{_DIVIDER}
+CURRENT PRODUCTION SYSTEM (No IAI):
+{_DIVIDER}
+✗ Keeps betting Home @ 4-6 odds
+✗ Doesn't detect edge has disappeared
+✗ Loses money for months before you manually notice
+✗ You have to manually research alternatives
+✗ You have to manually code new strategy
+✗ You have to manually deploy
+
+{_DIVIDER}
+IAI SYSTEM (Continuous Learning):
+{_DIVIDER}
+✓ Re-evaluates all 8 hypotheses weekly
+✓ Detects H1 edge dropped below 2%
+✓ Authority REJECTS H1 automatically
+✓ Evaluator finds H3 (Home Extreme 6-10) now has 4% edge
+✓ Authority ACCEPTS H3
+✓ System switches to H3 automatically
+✓ Continues making money with new strategy
+
+No manual intervention needed!
+"""
+
+_MULTI_STRATEGY_BANNER = f"""
+{_RULE}
+IAI CAPABILITY: Multi-Strategy Portfolio
+{_RULE}
+
+IAI doesn't have to pick ONE strategy - it can run MULTIPLE!
+
+Example portfolio:
+  • 60% bankroll → H1 (Home 4-6 odds) - Edge 3.3%
+  • 30% bankroll → H3 (Home 6-10 odds) - Edge 2.5%
+  • 10% bankroll → H7 (Away 6-10 odds) - Edge 1.0%
+
+Benefits:
+  ✓ Diversification - reduces variance
+  ✓ More betting opportunities
+  ✓ Exploits multiple market inefficiencies
+  ✓ Authority continuously rebalances based on performance
+"""
+
+_HYPOTHESIS_GENERATION_HEADER = f"""
+{_RULE}
+IAI CAPABILITY: Dynamic Hypothesis Generation
+{_RULE}
+
+IAI can GENERATE new hypotheses based on patterns:
+
+Example: League-specific strategies
+"""
+
+_HYPOTHESIS_GENERATION_FOOTER = """
+IAI can also generate hypotheses for:
+  • Time-based patterns (day of week, month, season)
+  • Team-specific patterns (form, home/away record)
+  • Odds movements (line shopping, steam moves)
+  • Combination strategies (home underdog + total goals)
+
+The system tests EVERYTHING and keeps what works!
+"""
+
+_ADAPTATION_CYCLE_BANNER = f"""
+{_RULE}
+IAI CONTINUOUS CYCLE
+{_RULE}
 
-def show_adaptation_cycle():
-    """Show the continuous adaptation cycle."""
-    print("\n" + "="*80)
-    print("IAI CONTINUOUS CYCLE")
-    print("="*80)
-    
-    print("""
     Week 1:
     ┌─────────────────────────────────────────────────────┐
     │ Deploy baseline: H1 (Home 4-6 odds)                │
@@ -151,16 +140,14 @@ def show_adaptation_cycle():
     └─────────────────────────────────────────────────────┘
     
     This happens AUTOMATICALLY, CONTINUOUSLY, FOREVER.
-    """)
+    
+"""
 
+_COMPARISON_BANNER = f"""
+{_RULE}
+PRODUCTION vs IAI: Side-by-Side
+{_RULE}
 
-def compare_systems():
-    """Direct comparison."""
-    print("\n" + "="*80)
-    print("PRODUCTION vs IAI: Side-by-Side")
-    print("="*80)
-    
-    comparison = """
     ┌──────────────────────────────┬─────────────────────────┬─────────────────────────┐
     │ Capability                   │ Current Production      │ IAI System              │
     ├──────────────────────────────┼─────────────────────────┼─────────────────────────┤
@@ -184,27 +171,14 @@ def compare_systems():
     ├──────────────────────────────┼─────────────────────────┼─────────────────────────┤
     │ Self-improving?              │ ✗ No                    │ ✓ Yes                   │
     └──────────────────────────────┴─────────────────────────┴─────────────────────────┘
-    """
-    print(comparison)
+    
+"""
 
+_SUMMARY_BANNER = f"""
+{_RULE}
+SUMMARY
+{_RULE}
 
-def main():
-    print("="*80)
-    print("IAI IS NOT 'PICK ONE STRATEGY AND STOP'")
-    print("It's a Continuous Learning Intelligence System")
-    print("="*80)
-    
-    simulate_market_shift()
-    demonstrate_multi_strategy()
-    demonstrate_hypothesis_generation()
-    show_adaptation_cycle()
-    compare_systems()
-    
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
-    
-    print("""
 The IAI system you now have locally is FAR more sophisticated than production:
 
 1. CURRENT PRODUCTION: 
@@ -223,7 +197,81 @@ This is the difference between:
 - Intelligence: "I continuously discover the best rules"
 
 Want me to show you how to deploy the continuous learning version?
-    """)
+    
+"""
+
+
+def simulate_market_shift():
+    """
+    Simulate what happens if market conditions change.
+    
+    IAI would detect this and switch strategies automatically.
+    Production system would keep using the old strategy and lose money.
+    """
+    sys.stdout.write(_MARKET_SHIFT_BANNER)
+
+
+def demonstrate_multi_strategy():
+    """Show that IAI can run multiple strategies simultaneously."""
+    sys.stdout.write(_MULTI_STRATEGY_BANNER)
+
+
+@lru_cache(maxsize=32)
+def _league_hypothesis(league: str) -> BettingHypothesis:
+    """League-specific home underdog hypothesis, built once per league.
+    
+    The instance is shared between calls, so callers must not change it.
+    """
+    return BettingHypothesis(
+        id=f"H_LEAGUE_{league}",
+        name=f"Home Underdogs in {league}",
+        description=f"Home 4-6 odds specifically in {league}",
+        selection="H",
+        odds_min=4.0,
+        odds_max=6.0,
+        stake_pct=3.0,
+        expected_edge=0.0,  # Unknown - to be discovered
+        expected_win_rate=0.0,
+        status="PROPOSED"
+    )
+
+
+def demonstrate_hypothesis_generation():
+    """Show how to dynamically generate new hypotheses."""
+    out = io.StringIO()
+    out.write(_HYPOTHESIS_GENERATION_HEADER)
+    
+    # Example: Generate hypotheses for different leagues
+    leagues = ["E0", "E1", "E2", "D1", "D2", "F1", "I1", "SP1"]
+    
+    new_hypotheses = [_league_hypothesis(league) for league in leagues[:3]]  # Show first 3
+    for h in new_hypotheses:
+        out.write(f"  ✓ {h.id}: {h.name}\n")
+    
+    out.write(_HYPOTHESIS_GENERATION_FOOTER)
+    sys.stdout.write(out.getvalue())
+
+
+def show_adaptation_cycle():
+    """Show the continuous adaptation cycle."""
+    sys.stdout.write(_ADAPTATION_CYCLE_BANNER)
+
+
+def compare_systems():
+    """Direct comparison."""
+    sys.stdout.write(_COMPARISON_BANNER)
+
+
+def main():
+    sys.stdout.write(_TITLE_BANNER)
+    
+    simulate_market_shift()
+    demonstrate_multi_strategy()
+    demonstrate_hypothesis_generation()
+    show_adaptation_cycle()
+    compare_systems()
+    
+    sys.stdout.write(_SUMMARY_BANNER)
 
 
 if __name__ == "__main__":
@@ -25,19 +25,31 @@ Authority's role is RISK MANAGEMENT, not strategy optimization.
 import sys
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+from typing import List, Dict, Tuple, NamedTuple, Optional
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import numpy as np
 
-from pilots.iai_betting.data import FootballDataLoader, Match
+# Add the iai_betting directory to path for imports
+iai_betting_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(iai_betting_dir))
 
+from core.data import FootballDataLoader
 
-@dataclass
+# rich is only needed by main(); importing this module for
+# run_strategy_by_season doesn't load it
+_console = None
+
+
+def _get_console():
+    """Shared rich Console, created on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+@dataclass(slots=True, frozen=True)
 class SeasonResult:
     """Results for a single season."""
     season: str
@@ -48,56 +60,252 @@ class SeasonResult:
     max_dd: float
 
 
+class PortfolioStrategy(NamedTuple):
+    """A candidate for the adaptive portfolio (a BettingHypothesis also fits)."""
+    selection: str  # "H", "D" or "A"
+    odds_min: float
+    odds_max: float
+
+
+# The strategies from demonstrate_multi_strategy's example portfolio
+PORTFOLIO_STRATEGIES = [
+    PortfolioStrategy("H", 4.0, 6.0),
+    PortfolioStrategy("H", 6.0, 10.0),
+    PortfolioStrategy("A", 6.0, 10.0),
+]
+
+# Season array holding the odds for each selection
+_ODDS_KEY = {"H": "home_odds", "D": "draw_odds", "A": "away_odds"}
+
+
+class SeasonResultsArrays(NamedTuple):
+    """The same results as columns, one array per SeasonResult field."""
+    season: np.ndarray
+    bets: np.ndarray
+    wins: np.ndarray
+    profit: np.ndarray
+    roi: np.ndarray
+    max_dd: np.ndarray
+    
+    @classmethod
+    def from_results(cls, results: List[SeasonResult]) -> "SeasonResultsArrays":
+        return cls(
+            season=np.array([r.season for r in results], dtype=str),
+            bets=np.array([r.bets for r in results], dtype=np.int64),
+            wins=np.array([r.wins for r in results], dtype=np.int64),
+            profit=np.array([r.profit for r in results], dtype=np.float64),
+            roi=np.array([r.roi for r in results], dtype=np.float64),
+            max_dd=np.array([r.max_dd for r in results], dtype=np.float64),
+        )
+
+
 def run_strategy_by_season(
-    matches_by_season: Dict[str, List[Match]],
+    arrays_by_season: Dict[str, Dict[str, np.ndarray]],
     min_odds: float = 4.0,
     max_odds: float = 6.0,
     stake_pct: float = 3.0,
 ) -> List[SeasonResult]:
-    """Run strategy and get season-by-season results."""
+    """Run strategy and get season-by-season results.
     
-    results = []
+    Takes each season as the arrays from FootballDataLoader.load_season_arrays.
+    All seasons are swept in one pass over the concatenated arrays, with the
+    bankroll reset to 1000 at the start of each season.
+    """
+    
+    seasons = sorted(arrays_by_season.keys())
+    if not seasons:
+        return []
+    
+    # The odds window [min_odds, max_odds) is a contiguous slice of each
+    # season's sorted home odds. Only those matches are gathered, back in
+    # file order since the bankroll path depends on it.
+    odds_parts, won_parts = [], []
+    for s in seasons:
+        data = arrays_by_season[s]
+        lo, hi = np.searchsorted(data["home_odds_sorted"], [min_odds, max_odds], side="left")
+        sel = np.sort(data["home_odds_order"][lo:hi])
+        odds_parts.append(data["home_odds"][sel])
+        won_parts.append(data["result"][sel] == "H")
+    
+    season_id = np.repeat(np.arange(len(seasons)), [len(part) for part in odds_parts])
+    if not len(season_id):
+        return []
+    odds = np.concatenate(odds_parts)
+    won = np.concatenate(won_parts)
+    
+    # Bets are grouped by season, in season order; one run per season that bet
+    starts = np.flatnonzero(np.r_[True, season_id[1:] != season_id[:-1]])
+    ends = np.r_[starts[1:], len(season_id)] - 1
+    bets = np.diff(np.r_[starts, len(season_id)])
+    wins = np.add.reduceat(won.astype(np.int64), starts)
+    
+    # Stake is a fixed fraction of the running bankroll, so within a season
+    # the log bankroll is a cumulative sum of per-bet log growth factors,
+    # measured from that season's starting 1000
+    returns = np.where(won, odds - 1.0, -1.0)
+    log_growth = np.log1p((stake_pct / 100) * returns)
+    cum = np.cumsum(log_growth)
+    log_path = cum - np.repeat(cum[starts] - log_growth[starts], bets)
+    
+    # Drawdown from the running peak (which starts at the initial 1000). An
+    # offset per season larger than any in-season value keeps one running
+    # maximum from carrying over between seasons.
+    floored = np.maximum(log_path, 0.0)
+    offset = season_id * (floored.max() + 1.0)
+    log_peak = np.maximum.accumulate(floored + offset) - offset
+    drawdown = -np.expm1(log_path - log_peak)
+    max_dd = np.maximum.reduceat(drawdown, starts) * 100
+    
+    bankrolls = 1000.0 * np.exp(log_path[ends])
+    
+    return [
+        SeasonResult(
+            season=seasons[sid],
+            bets=int(n),
+            wins=int(w),
+            profit=float(bankroll) - 1000,
+            roi=(float(bankroll) - 1000) / 1000 * 100,
+            max_dd=float(dd),
+        )
+        for sid, n, w, bankroll, dd in zip(season_id[starts], bets, wins, bankrolls, max_dd)
+    ]
+
+
+def thompson_allocate(
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    mean_odds: np.ndarray,
+    rng: np.random.Generator,
+) -> int:
+    """Pick an arm by Thompson sampling.
+    
+    Each arm's win rate is drawn from its Beta(alpha, beta) posterior and
+    the arm with the best sampled expected return (win rate x mean odds)
+    is chosen; comparing raw win rates would always favour shorter odds.
+    """
+    return int(np.argmax(rng.beta(alpha, beta) * mean_odds))
+
+
+def simulate_adaptive_portfolio(
+    arrays_by_season: Dict[str, Dict[str, np.ndarray]],
+    strategies: List[PortfolioStrategy],
+    stake_pct: float = 3.0,
+    round_size: int = 10,
+    seed: int = 0,
+) -> List[SeasonResult]:
+    """Allocate between strategies by Thompson sampling, season by season.
+    
+    Matches are taken in rounds of round_size, in file order. Before each
+    round one strategy is picked with thompson_allocate and its qualifying
+    matches in that round are bet at stake_pct of the running bankroll.
+    Results are public whether or not a strategy was bet, so every
+    strategy's Beta posterior (from a uniform prior) is updated after each
+    round. Posteriors carry over between seasons; the bankroll resets to
+    1000 each season, as in run_strategy_by_season.
+    """
+    rng = np.random.default_rng(seed)
+    odds_min = np.array([s.odds_min for s in strategies])[:, None]
+    odds_max = np.array([s.odds_max for s in strategies])[:, None]
+    
+    alpha = np.ones(len(strategies))
+    beta = np.ones(len(strategies))
+    # Mean odds start as one pseudo-bet at the middle of each odds range
+    odds_sum = (odds_min + odds_max).ravel() / 2
+    odds_count = np.ones(len(strategies))
     
-    for season in sorted(matches_by_season.keys()):
-        matches = matches_by_season[season]
-        bankroll = 1000.0
-        peak = 1000.0
-        max_dd = 0
-        wins = 0
-        bets = 0
+    results = []
+    for season in sorted(arrays_by_season):
+        data = arrays_by_season[season]
+        n = len(data["result"])
+        if not n:
+            continue
+        
+        # One row per strategy, one column per match
+        odds = np.stack([data[_ODDS_KEY[s.selection]] for s in strategies])
+        won = np.stack([data["result"] == s.selection for s in strategies])
+        qualifies = (odds >= odds_min) & (odds < odds_max)
+        
+        starts = np.arange(0, n, round_size)
+        round_bets = np.add.reduceat(qualifies.astype(np.int64), starts, axis=1)
+        round_wins = np.add.reduceat((qualifies & won).astype(np.int64), starts, axis=1)
+        round_odds = np.add.reduceat(np.where(qualifies, odds, 0.0), starts, axis=1)
         
-        for m in matches:
-            odds = m.odds.home_odds
-            if min_odds <= odds < max_odds:
-                stake = bankroll * (stake_pct / 100)
-                won = m.result == "H"
-                profit = stake * (odds - 1) if won else -stake
-                bankroll += profit
-                bets += 1
-                if won:
-                    wins += 1
-                
-                if bankroll > peak:
-                    peak = bankroll
-                dd = (peak - bankroll) / peak * 100
-                if dd > max_dd:
-                    max_dd = dd
+        # Choices depend only on past results, not on the bankroll, so all
+        # rounds are chosen first and the bankroll is swept afterwards
+        chosen = np.empty(len(starts), dtype=np.intp)
+        for r in range(len(starts)):
+            chosen[r] = thompson_allocate(alpha, beta, odds_sum / odds_count, rng)
+            alpha += round_wins[:, r]
+            beta += round_bets[:, r] - round_wins[:, r]
+            odds_sum += round_odds[:, r]
+            odds_count += round_bets[:, r]
         
-        if bets > 0:
-            results.append(SeasonResult(
-                season=season,
-                bets=bets,
-                wins=wins,
-                profit=bankroll - 1000,
-                roi=(bankroll - 1000) / 1000 * 100,
-                max_dd=max_dd,
-            ))
+        arm = np.repeat(chosen, np.diff(np.r_[starts, n]))
+        match = np.arange(n)
+        bet = qualifies[arm, match]
+        if not bet.any():
+            continue
+        bet_odds = odds[arm, match][bet]
+        bet_won = won[arm, match][bet]
+        
+        log_path = np.cumsum(np.log1p((stake_pct / 100) * np.where(bet_won, bet_odds - 1.0, -1.0)))
+        log_peak = np.maximum.accumulate(np.maximum(log_path, 0.0))
+        bankroll = 1000.0 * float(np.exp(log_path[-1]))
+        
+        results.append(SeasonResult(
+            season=season,
+            bets=int(bet.sum()),
+            wins=int(bet_won.sum()),
+            profit=bankroll - 1000,
+            roi=(bankroll - 1000) / 1000 * 100,
+            max_dd=float(np.max(-np.expm1(log_path - log_peak))) * 100,
+        ))
     
     return results
 
 
+def adwin_detect(
+    wins: np.ndarray,
+    bets: np.ndarray,
+    delta: float = 0.002,
+) -> Optional[int]:
+    """ADWIN change test (Bifet & Gavalda, 2007) on a win/loss record.
+    
+    The record is given as wins and bets per block (here, seasons in order;
+    every block must have bets). Each split into an older and a newer window
+    is tested: the win rates differ significantly when they are further apart
+    than eps_cut = sqrt(ln(4n / delta) / (2m)), where n is the total bets and
+    m = 1 / (1/n0 + 1/n1) for window sizes n0 and n1.
+    
+    Returns the index of the first block of the newer window for the most
+    significant split, or None if the win rate looks stationary.
+    """
+    wins = np.asarray(wins, dtype=np.float64)
+    bets = np.asarray(bets, dtype=np.float64)
+    if len(bets) < 2:
+        return None
+    
+    n = bets.sum()
+    n0 = np.cumsum(bets)[:-1]
+    w0 = np.cumsum(wins)[:-1]
+    n1 = n - n0
+    w1 = wins.sum() - w0
+    
+    gap = np.abs(w0 / n0 - w1 / n1)
+    m = 1.0 / (1.0 / n0 + 1.0 / n1)
+    eps_cut = np.sqrt(np.log(4 * n / delta) / (2 * m))
+    
+    excess = gap - eps_cut
+    best = int(np.argmax(excess))
+    return best + 1 if excess[best] > 0 else None
+
+
 def main():
-    console = Console()
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich import box
+    
+    console = _get_console()
     
     console.print("\n")
     console.print("╔" + "═" * 78 + "╗", style="bold cyan")
@@ -108,19 +316,26 @@ def main():
     loader = FootballDataLoader()
     seasons = ["1516", "1617", "1718", "1819", "1920", "2021", "2122", "2223", "2324"]
     
-    matches_by_season = {}
+    # Download any season not on disk yet; one that can't be fetched is skipped
     for season in seasons:
-        try:
-            data = loader.load_season("E0", season)
-            if data:
-                matches_by_season[season] = data
-        except:
-            pass
+        if not loader.has_season("E0", season):
+            try:
+                loader.download_season("E0", season)
+            except (OSError, ValueError):
+                pass
     
-    console.print(f"\n[green]Loaded {len(matches_by_season)} seasons[/green]\n")
+    arrays_by_season = {}
+    for season in seasons:
+        if loader.has_season("E0", season):
+            data = loader.load_season_arrays("E0", season)
+            if len(data["result"]):
+                arrays_by_season[season] = data
+    
+    console.print(f"\n[green]Loaded {len(arrays_by_season)} seasons[/green]\n")
     
     # Run static strategy
-    results = run_strategy_by_season(matches_by_season)
+    results = run_strategy_by_season(arrays_by_season)
+    arrs = SeasonResultsArrays.from_results(results)
     
     # Display season-by-season
     console.print("[bold]SEASON-BY-SEASON PERFORMANCE[/bold]\n")
@@ -134,27 +349,30 @@ def main():
     table.add_column("Max DD", justify="right")
     table.add_column("Verdict", justify="center")
     
-    profitable_seasons = 0
-    total_profit = 0
+    # Cells are formatted a column at a time; the loop only assembles rows.
+    # Only seasons with at least one bet are returned, so bets is never 0.
+    win_pct = np.char.mod("%.1f%%", arrs.wins / arrs.bets * 100).tolist()
+    roi_pct = np.char.mod("%+.1f%%", arrs.roi).tolist()
+    max_dd = np.char.mod("%.1f%%", arrs.max_dd).tolist()
+    colors = np.where(arrs.roi > 0, "green", "red").tolist()
+    verdicts = np.where(arrs.roi > 0, "✅", "❌").tolist()
     
-    for r in results:
-        win_pct = r.wins / r.bets * 100 if r.bets > 0 else 0
-        color = "green" if r.roi > 0 else "red"
-        verdict = "✅" if r.roi > 0 else "❌"
-        
+    for season, bets, wins, win, roi, dd, color, verdict in zip(
+        arrs.season.tolist(), arrs.bets.tolist(), arrs.wins.tolist(),
+        win_pct, roi_pct, max_dd, colors, verdicts,
+    ):
         table.add_row(
-            f"20{r.season[:2]}/{r.season[2:]}",
-            str(r.bets),
-            str(r.wins),
-            f"{win_pct:.1f}%",
-            f"[{color}]{r.roi:+.1f}%[/{color}]",
-            f"{r.max_dd:.1f}%",
+            f"20{season[:2]}/{season[2:]}",
+            str(bets),
+            str(wins),
+            win,
+            f"[{color}]{roi}[/{color}]",
+            dd,
             verdict,
         )
-        
-        if r.roi > 0:
-            profitable_seasons += 1
-        total_profit += r.profit
+    
+    profitable_seasons = int((arrs.roi > 0).sum())
+    total_profit = float(arrs.profit.sum())
     
     console.print(table)
     
@@ -197,14 +415,11 @@ def main():
     console.print("[yellow]SCENARIO 3: Could Authority detect if edge disappears?[/yellow]")
     console.print()
     
-    # Check recent vs early edge
-    early = results[:4]  # First 4 seasons
-    recent = results[-4:]  # Last 4 seasons
-    
-    early_wins = sum(r.wins for r in early)
-    early_bets = sum(r.bets for r in early)
-    recent_wins = sum(r.wins for r in recent)
-    recent_bets = sum(r.bets for r in recent)
+    # Check recent vs early edge: first 4 seasons against last 4
+    early_wins = arrs.wins[:4].sum()
+    early_bets = arrs.bets[:4].sum()
+    recent_wins = arrs.wins[-4:].sum()
+    recent_bets = arrs.bets[-4:].sum()
     
     early_wr = early_wins / early_bets * 100 if early_bets else 0
     recent_wr = recent_wins / recent_bets * 100 if recent_bets else 0
@@ -213,11 +428,32 @@ def main():
     console.print(f"  Recent seasons (2020-2024): {recent_wr:.1f}% win rate")
     console.print()
     
-    if recent_wr < early_wr - 3:
+    # A decline only counts if ADWIN finds a significant change in win rate
+    # and the seasons after it win less often than those before
+    cut = adwin_detect(arrs.wins, arrs.bets)
+    declining = cut is not None and (
+        arrs.wins[cut:].sum() / arrs.bets[cut:].sum()
+        < arrs.wins[:cut].sum() / arrs.bets[:cut].sum()
+    )
+    
+    if declining:
         console.print("  [yellow]⚠️ Win rate declining - market may be adapting[/yellow]")
     else:
         console.print("  [green]Edge appears stable over time[/green]")
     
+    console.print()
+    console.print("[yellow]SCENARIO 4: Could Authority switch between strategies?[/yellow]")
+    console.print()
+    
+    adaptive = SeasonResultsArrays.from_results(
+        simulate_adaptive_portfolio(arrays_by_season, PORTFOLIO_STRATEGIES)
+    )
+    console.print(f"  Static Home @ 4.0-6.0: £{total_profit:+,.0f} "
+                  f"({profitable_seasons}/{len(results)} seasons profitable)")
+    console.print(f"  Thompson sampling over {len(PORTFOLIO_STRATEGIES)} strategies: "
+                  f"£{adaptive.profit.sum():+,.0f} "
+                  f"({int((adaptive.roi > 0).sum())}/{len(adaptive.roi)} seasons profitable)")
+    
     # Final verdict
     console.print("\n" + "━" * 80)
     console.print("\n[bold]VERDICT: What IAI adds to betting[/bold]\n")
@@ -9,19 +9,28 @@ The question: Does IAI adaptation BEAT a static strategy?
 """
 
 import sys
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Deque, Union
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 import json
+import numpy as np
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add the iai_betting directory to path for imports
+iai_betting_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(iai_betting_dir))
 
-from pilots.iai_betting.data import FootballDataLoader, Match
+from core.data import FootballDataLoader
+
+# Per-match arrays the strategies run on (see load_league_arrays)
+MATCH_ARRAY_KEYS = ("home_odds", "draw_odds", "away_odds", "result")
+
+# Array holding the odds for each selection
+_ODDS_KEY = {"H": "home_odds", "D": "draw_odds", "A": "away_odds"}
 
 
 @dataclass
@@ -55,6 +64,16 @@ class StrainSignal:
     is_critical: bool = False  # Should pause betting
 
 
+@dataclass
+class BacktestStats:
+    """Summary of a strategy run, gathered while the bankroll path is built."""
+    n_bets: int = 0
+    wins: int = 0
+    total_staked: float = 0.0
+    final_bankroll: float = 0.0
+    max_drawdown: float = 0.0  # Largest fall from a running peak (incl. the start), as a fraction
+
+
 @dataclass 
 class AuthorityDecision:
     """What the Authority decides to do."""
@@ -64,49 +83,62 @@ class AuthorityDecision:
     new_invariants: Optional[BettingInvariants] = None
 
 
+@dataclass
+class SimResult:
+    """Outcome of an IAI strategy run (see run_iai_strategy)."""
+    stats: BacktestStats
+    won: np.ndarray  # Whether each bet won, in order
+    bankroll: np.ndarray  # Bankroll after each bet
+    decisions: List[AuthorityDecision]
+    bets: Optional[List[Dict]] = None  # Full per-bet records, only from a verbose run
+    
+    @property
+    def final_bankroll(self) -> float:
+        return self.stats.final_bankroll
+
+
 class BettingChallenger:
     """Detects strain in the betting strategy."""
     
     def __init__(self, lookback: int = 20):
         self.lookback = lookback
-        self.recent_bets: List[Dict] = []
-    
-    def record_bet(self, odds: float, won: bool):
-        """Record a bet result."""
-        self.recent_bets.append({
-            "odds": odds,
-            "won": won,
-            "implied_prob": 1 / odds,
-        })
-        # Keep only recent
-        if len(self.recent_bets) > self.lookback * 2:
-            self.recent_bets = self.recent_bets[-self.lookback:]
+        # Last `lookback` bets as (won, implied_prob), plus running totals
+        # over them so analyze() doesn't rescan the window
+        self.window: Deque[Tuple[bool, float]] = deque(maxlen=lookback)
+        self.wins = 0
+        self.sum_implied = 0.0
+        self.consec_losses = 0
+    
+    def record_bet(self, implied_prob: float, won: bool):
+        """Record a bet result, given the implied probability (1 / odds) of the bet."""
+        if len(self.window) == self.lookback:
+            # The oldest bet is about to be evicted
+            old_won, old_implied = self.window[0]
+            self.wins -= old_won
+            self.sum_implied -= old_implied
+        
+        self.window.append((won, implied_prob))
+        self.wins += won
+        self.sum_implied += implied_prob
+        self.consec_losses = 0 if won else self.consec_losses + 1
     
     def analyze(self, invariants: BettingInvariants) -> StrainSignal:
         """Analyze recent performance for strain signals."""
         signal = StrainSignal()
         
-        if len(self.recent_bets) < 5:
+        n = len(self.window)
+        if n < 5:
             return signal
         
-        recent = self.recent_bets[-self.lookback:]
-        
-        # Count consecutive losses from end
-        consecutive_losses = 0
-        for bet in reversed(recent):
-            if not bet["won"]:
-                consecutive_losses += 1
-            else:
-                break
+        # Consecutive losses from the end, counted within the window
+        consecutive_losses = min(self.consec_losses, n)
         signal.consecutive_losses = consecutive_losses
         
         # Recent win rate
-        wins = sum(1 for b in recent if b["won"])
-        signal.recent_win_rate = wins / len(recent)
+        signal.recent_win_rate = self.wins / n
         
         # Recent edge (actual - implied)
-        implied = sum(b["implied_prob"] for b in recent) / len(recent)
-        signal.recent_edge = signal.recent_win_rate - implied
+        signal.recent_edge = signal.recent_win_rate - self.sum_implied / n
         
         # Is underperforming?
         signal.is_underperforming = signal.recent_edge < 0
@@ -114,7 +146,7 @@ class BettingChallenger:
         # Is critical? (should pause)
         signal.is_critical = (
             consecutive_losses >= invariants.max_consecutive_losses or
-            (len(recent) >= 15 and signal.recent_edge < -0.05)  # Very negative edge
+            (n >= 15 and signal.recent_edge < -0.05)  # Very negative edge
         )
         
         return signal
@@ -137,6 +169,9 @@ class BettingAuthority:
         self.bets_since_last_decision = 0
         self.original_invariants: Optional[BettingInvariants] = None
     
+    def observe(self, odds: float, won: bool):
+        """Outcomes reach this Authority through the Challenger's strain signal."""
+    
     def review(
         self,
         invariants: BettingInvariants,
@@ -234,68 +269,252 @@ class BettingAuthority:
         )
 
 
+class ThompsonAuthority:
+    """Authority that chooses full stake, half stake or pause by Thompson sampling.
+    
+    No hand-set thresholds: every arm bets on the same outcome, so the arms
+    share one Beta posterior over the win rate in the odds window, updated
+    with every qualifying match (paused ones included - their results are
+    still observed). Each review samples a win rate from the posterior and
+    picks the arm with the highest expected log growth of the bankroll at
+    the average odds seen so far.
+    """
+    
+    def __init__(self, prior_wins: float = 1.0, prior_losses: float = 1.0, seed: int = 0):
+        self.decisions_log: List[AuthorityDecision] = []
+        self.alpha = prior_wins
+        self.beta = prior_losses
+        self.odds_sum = 0.0
+        self.n_observed = 0
+        self.rng = np.random.default_rng(seed)
+        self.original_invariants: Optional[BettingInvariants] = None
+    
+    def observe(self, odds: float, won: bool):
+        """Update the win-rate posterior with a settled match."""
+        if won:
+            self.alpha += 1.0
+        else:
+            self.beta += 1.0
+        self.odds_sum += odds
+        self.n_observed += 1
+    
+    def review(
+        self,
+        invariants: BettingInvariants,
+        strain: StrainSignal,
+        overall_roi: float,
+    ) -> AuthorityDecision:
+        """Sample a win rate and act on the best arm for it."""
+        if self.original_invariants is None:
+            self.original_invariants = invariants
+        
+        # Arms: full stake, half stake, pause
+        stakes = (self.original_invariants.stake_pct, self.original_invariants.stake_pct / 2, 0.0)
+        fractions = np.array(stakes) / 100
+        if self.n_observed:
+            mean_odds = self.odds_sum / self.n_observed
+        else:
+            mean_odds = (invariants.min_odds + invariants.max_odds) / 2
+        
+        win_rate = self.rng.beta(self.alpha, self.beta)
+        growth = win_rate * np.log1p(fractions * (mean_odds - 1)) + (1 - win_rate) * np.log1p(-fractions)
+        stake_pct = stakes[int(np.argmax(growth))]
+        
+        if stake_pct == 0.0:
+            return AuthorityDecision(
+                action="PAUSE",
+                confidence=0.5,
+                rationale="Sampled win rate is below break-even. Skipping this match.",
+            )
+        
+        if stake_pct != invariants.stake_pct:
+            new_inv = BettingInvariants(
+                selection=invariants.selection,
+                min_odds=invariants.min_odds,
+                max_odds=invariants.max_odds,
+                stake_pct=stake_pct,
+                min_edge_required=invariants.min_edge_required,
+                max_consecutive_losses=invariants.max_consecutive_losses,
+            )
+            decision = AuthorityDecision(
+                action="ADJUST",
+                confidence=0.5,
+                rationale=f"Stake {invariants.stake_pct}% -> {stake_pct}% "
+                          f"(sampled win rate {win_rate:.1%} at {mean_odds:.2f} odds)",
+                new_invariants=new_inv,
+            )
+            self.decisions_log.append(decision)
+            return decision
+        
+        return AuthorityDecision(
+            action="CONTINUE",
+            confidence=0.5,
+            rationale="Current stake is the best arm for the sampled win rate",
+        )
+
+
+def load_league_arrays(
+    loader: FootballDataLoader,
+    league: str,
+    seasons: List[str],
+) -> Optional[Dict[str, np.ndarray]]:
+    """All available seasons of a league as one set of match arrays.
+    
+    Seasons come from FootballDataLoader.load_season_arrays and are
+    concatenated in the order given; a season that can't be downloaded is
+    skipped. Returns None if none could be loaded.
+    """
+    parts = []
+    for season in seasons:
+        try:
+            parts.append(loader.load_season_arrays(league, season))
+        except (OSError, ValueError):
+            continue  # Season could not be downloaded
+    
+    if not parts:
+        return None
+    return {key: np.concatenate([part[key] for part in parts]) for key in MATCH_ARRAY_KEYS}
+
+
 def run_static_strategy(
-    matches: List[Match],
+    arrays: Dict[str, np.ndarray],
     invariants: BettingInvariants,
     starting_bankroll: float = 1000.0,
-) -> Tuple[float, List[Dict]]:
-    """Run a static (non-adaptive) strategy."""
-    bankroll = starting_bankroll
-    bets = []
-    
-    for m in matches:
-        if invariants.selection == "H":
-            odds = m.odds.home_odds
-            won = m.result == "H"
-        elif invariants.selection == "D":
-            odds = m.odds.draw_odds
-            won = m.result == "D"
-        else:
-            odds = m.odds.away_odds
-            won = m.result == "A"
-        
-        if invariants.min_odds <= odds < invariants.max_odds:
-            stake = bankroll * (invariants.stake_pct / 100)
-            profit = stake * (odds - 1) if won else -stake
-            bankroll += profit
-            bets.append({
-                "match": f"{m.home_team} vs {m.away_team}",
-                "odds": odds,
-                "stake": stake,
-                "won": won,
-                "profit": profit,
-                "bankroll": bankroll,
-            })
+) -> Tuple[BacktestStats, Dict[str, np.ndarray]]:
+    """Run a static (non-adaptive) strategy.
     
-    return bankroll, bets
+    Takes the matches as arrays (see load_league_arrays). Returns the run's
+    BacktestStats and the bets as arrays: "odds", "stake", "won", "profit"
+    and "bankroll" (after each bet).
+    """
+    odds = arrays[_ODDS_KEY[invariants.selection]]
+    mask = (odds >= invariants.min_odds) & (odds < invariants.max_odds)
+    odds = odds[mask]
+    won = arrays["result"][mask] == invariants.selection
+    
+    # Each bet stakes a fixed fraction of the running bankroll, so the
+    # bankroll path is a cumulative product of per-bet growth factors
+    # (accumulated in place in the growth array rather than into new ones)
+    s = invariants.stake_pct / 100
+    bankroll = np.where(won, 1 + s * (odds - 1), 1 - s)
+    np.cumprod(bankroll, out=bankroll)
+    bankroll *= starting_bankroll
+    stake = np.concatenate(([starting_bankroll], bankroll[:-1])) * s
+    
+    bets = {
+        "odds": odds,
+        "stake": stake,
+        "won": won,
+        "profit": np.where(won, stake * (odds - 1), -stake),
+        "bankroll": bankroll,
+    }
+    
+    stats = BacktestStats(final_bankroll=starting_bankroll)
+    if len(bankroll):
+        peak = np.maximum.accumulate(bankroll)
+        np.maximum(peak, starting_bankroll, out=peak)
+        stats = BacktestStats(
+            n_bets=len(bankroll),
+            wins=int(won.sum()),
+            total_staked=float(stake.sum()),
+            final_bankroll=float(bankroll[-1]),
+            max_drawdown=float(((peak - bankroll) / peak).max()),
+        )
+    return stats, bets
+
+
+def build_odds_index(arrays: Dict[str, np.ndarray]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Per selection, its odds sorted ascending and whether each of those bets won.
+    
+    Built once per set of match arrays, so that run_static_aggregate can find
+    the bets in an odds window with two binary searches instead of a scan.
+    """
+    index = {}
+    for selection, key in _ODDS_KEY.items():
+        order = np.argsort(arrays[key], kind="stable")
+        index[selection] = (arrays[key][order], arrays["result"][order] == selection)
+    return index
+
+
+def run_static_aggregate(
+    index: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    invariants: BettingInvariants,
+    starting_bankroll: float = 1000.0,
+) -> BacktestStats:
+    """Bets, wins and final bankroll of a static strategy, for parameter sweeps.
+    
+    A fixed-fraction bankroll ends at the product of its per-bet growth
+    factors whatever order the bets come in, so they can be taken out of
+    odds order (see build_odds_index). The order-dependent stats, total
+    staked and max drawdown, are left at 0 - use run_static_strategy for
+    those and for the bankroll path.
+    """
+    odds, won = index[invariants.selection]
+    lo = np.searchsorted(odds, invariants.min_odds, side="left")
+    hi = np.searchsorted(odds, invariants.max_odds, side="left")
+    odds, won = odds[lo:hi], won[lo:hi]
+    
+    s = invariants.stake_pct / 100
+    growth = np.where(won, 1 + s * (odds - 1), 1 - s)
+    return BacktestStats(
+        n_bets=hi - lo,
+        wins=int(won.sum()),
+        final_bankroll=starting_bankroll * float(growth.prod()),
+    )
+
+
+def _selection_columns(arrays: Dict[str, np.ndarray], selection: str) -> Tuple[List[float], List[float]]:
+    """Odds on `selection` for every match, and their implied probabilities, as lists."""
+    odds = arrays[_ODDS_KEY[selection]]
+    return odds.tolist(), np.reciprocal(odds).tolist()
 
 
 def run_iai_strategy(
-    matches: List[Match],
+    arrays: Dict[str, np.ndarray],
     starting_invariants: BettingInvariants,
     starting_bankroll: float = 1000.0,
-) -> Tuple[float, List[Dict], List[AuthorityDecision]]:
-    """Run the IAI adaptive strategy."""
+    authority: Optional[Union[BettingAuthority, ThompsonAuthority]] = None,
+    verbose: bool = False,
+) -> SimResult:
+    """Run the IAI adaptive strategy over match arrays (see load_league_arrays).
+    
+    Uses the rule-based BettingAuthority unless another Authority is given.
+    Per-bet dicts (odds, stake, profit, invariants, ...) are only built when
+    `verbose` is set; otherwise bets are kept as won/bankroll arrays.
+    """
     bankroll = starting_bankroll
     invariants = starting_invariants
     
     challenger = BettingChallenger(lookback=20)
-    authority = BettingAuthority()
+    if authority is None:
+        authority = BettingAuthority()
     
-    bets = []
+    won_log = []
+    bankroll_log = []
+    bets = [] if verbose else None
     decisions = []
+    # PAUSE decisions are logged once per distinct (confidence, rationale);
+    # a set lookup instead of scanning the decisions list on every paused match
+    logged_pauses = set()
     skipped = 0
     
-    for m in matches:
-        if invariants.selection == "H":
-            odds = m.odds.home_odds
-            won = m.result == "H"
-        elif invariants.selection == "D":
-            odds = m.odds.draw_odds
-            won = m.result == "D"
-        else:
-            odds = m.odds.away_odds
-            won = m.result == "A"
+    # Summary stats, kept up to date as each bet settles
+    wins = 0
+    total_staked = 0.0
+    peak = starting_bankroll
+    max_drawdown = 0.0
+    
+    # The loop is inherently sequential, so it runs over plain lists, which
+    # index faster than NumPy scalars. Selection only changes with the
+    # invariants, so its odds column (and implied probabilities, 1 / odds,
+    # in one vector pass) is picked here and again after an ADJUST.
+    results = arrays["result"].tolist()
+    odds_col, implied_col = _selection_columns(arrays, invariants.selection)
+    target = invariants.selection
+    
+    for i, result in enumerate(results):
+        odds = odds_col[i]
+        won = result == target
         
         if invariants.min_odds <= odds < invariants.max_odds:
             # Get strain signal
@@ -307,13 +526,18 @@ def run_iai_strategy(
             
             if decision.action == "PAUSE":
                 skipped += 1
-                if decision not in decisions:
+                authority.observe(odds, won)
+                pause_key = (decision.confidence, decision.rationale)
+                if pause_key not in logged_pauses:
+                    logged_pauses.add(pause_key)
                     decisions.append(decision)
                 continue
             
             if decision.action == "ADJUST" and decision.new_invariants:
                 decisions.append(decision)
                 invariants = decision.new_invariants
+                odds_col, implied_col = _selection_columns(arrays, invariants.selection)
+                target = invariants.selection
                 # Re-check if still qualifies under new invariants
                 if not (invariants.min_odds <= odds < invariants.max_odds):
                     continue
@@ -323,20 +547,44 @@ def run_iai_strategy(
             profit = stake * (odds - 1) if won else -stake
             bankroll += profit
             
+            wins += won
+            total_staked += stake
+            if bankroll > peak:
+                peak = bankroll
+            drawdown = (peak - bankroll) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
+            
             # Record for challenger
-            challenger.record_bet(odds, won)
+            challenger.record_bet(implied_col[i], won)
+            authority.observe(odds, won)
             
-            bets.append({
-                "match": f"{m.home_team} vs {m.away_team}",
-                "odds": odds,
-                "stake": stake,
-                "won": won,
-                "profit": profit,
-                "bankroll": bankroll,
-                "invariants": invariants.to_dict(),
-            })
-    
-    return bankroll, bets, decisions
+            won_log.append(won)
+            bankroll_log.append(bankroll)
+            if verbose:
+                bets.append({
+                    "odds": odds,
+                    "stake": stake,
+                    "won": won,
+                    "profit": profit,
+                    "bankroll": bankroll,
+                    "invariants": invariants.to_dict(),
+                })
+    
+    stats = BacktestStats(
+        n_bets=len(won_log),
+        wins=wins,
+        total_staked=total_staked,
+        final_bankroll=bankroll,
+        max_drawdown=max_drawdown,
+    )
+    return SimResult(
+        stats=stats,
+        won=np.array(won_log, dtype=bool),
+        bankroll=np.array(bankroll_log, dtype=np.float64),
+        decisions=decisions,
+        bets=bets,
+    )
 
 
 def main():
@@ -353,16 +601,12 @@ def main():
     loader = FootballDataLoader()
     seasons = ["1516", "1617", "1718", "1819", "1920", "2021", "2122", "2223", "2324"]
     
-    all_matches = []
-    for season in seasons:
-        try:
-            matches = loader.load_season("E0", season)
-            if matches:
-                all_matches.extend(matches)
-        except:
-            pass
+    arrays = load_league_arrays(loader, "E0", seasons)
+    if arrays is None:
+        console.print("[red]No seasons could be loaded[/red]")
+        return
     
-    console.print(f"[green]✓ Loaded {len(all_matches)} matches[/green]\n")
+    console.print(f"[green]✓ Loaded {len(arrays['result'])} matches[/green]\n")
     
     # Define starting strategy
     starting_invariants = BettingInvariants(
@@ -376,23 +620,43 @@ def main():
     
     # Run STATIC strategy
     console.print("[bold yellow]Running STATIC strategy...[/bold yellow]")
-    static_final, static_bets = run_static_strategy(all_matches, starting_invariants, starting_bankroll)
+    static_stats, static_bets = run_static_strategy(arrays, starting_invariants, starting_bankroll)
+    static_final = static_stats.final_bankroll
     static_roi = (static_final - starting_bankroll) / starting_bankroll * 100
-    static_wins = sum(1 for b in static_bets if b["won"])
+    static_n_bets = static_stats.n_bets
+    static_wins = static_stats.wins
+    
+    static_win_rate = f"{static_wins/static_n_bets*100:.1f}%" if static_n_bets else "N/A"
     
-    console.print(f"  Bets: {len(static_bets)}, Wins: {static_wins} ({static_wins/len(static_bets)*100:.1f}%)")
+    console.print(f"  Bets: {static_n_bets}, Wins: {static_wins} ({static_win_rate})")
     console.print(f"  Final: £{static_final:.0f}, ROI: {static_roi:+.1f}%\n")
     
     # Run IAI strategy
     console.print("[bold cyan]Running IAI ADAPTIVE strategy...[/bold cyan]")
-    iai_final, iai_bets, iai_decisions = run_iai_strategy(all_matches, starting_invariants, starting_bankroll)
+    iai_result = run_iai_strategy(arrays, starting_invariants, starting_bankroll)
+    iai_stats = iai_result.stats
+    iai_decisions = iai_result.decisions
+    iai_final = iai_stats.final_bankroll
     iai_roi = (iai_final - starting_bankroll) / starting_bankroll * 100
-    iai_wins = sum(1 for b in iai_bets if b["won"])
+    iai_n_bets = iai_stats.n_bets
+    iai_wins = iai_stats.wins
+    
+    iai_win_rate = f"{iai_wins/iai_n_bets*100:.1f}%" if iai_n_bets else "N/A"
     
-    console.print(f"  Bets: {len(iai_bets)}, Wins: {iai_wins} ({iai_wins/len(iai_bets)*100:.1f}% if iai_bets else 0)")
+    console.print(f"  Bets: {iai_n_bets}, Wins: {iai_wins} ({iai_win_rate})")
     console.print(f"  Final: £{iai_final:.0f}, ROI: {iai_roi:+.1f}%")
     console.print(f"  Authority decisions: {len(iai_decisions)}\n")
     
+    # Same loop with the Thompson-sampling Authority instead of fixed thresholds
+    console.print("[bold cyan]Running IAI THOMPSON strategy...[/bold cyan]")
+    ts_result = run_iai_strategy(
+        arrays, starting_invariants, starting_bankroll, authority=ThompsonAuthority()
+    )
+    ts_stats = ts_result.stats
+    ts_roi = (ts_stats.final_bankroll - starting_bankroll) / starting_bankroll * 100
+    console.print(f"  Bets: {ts_stats.n_bets}, Final: £{ts_stats.final_bankroll:.0f}, ROI: {ts_roi:+.1f}%")
+    console.print(f"  Authority decisions: {len(ts_result.decisions)}\n")
+    
     # Comparison
     console.print("━" * 80)
     console.print("[bold]COMPARISON[/bold]\n")
@@ -419,33 +683,20 @@ def main():
     )
     table.add_row(
         "Total Bets",
-        str(len(static_bets)),
-        str(len(iai_bets)),
+        str(static_n_bets),
+        str(iai_n_bets),
         "-",
     )
     table.add_row(
         "Win Rate",
-        f"{static_wins/len(static_bets)*100:.1f}%",
-        f"{iai_wins/len(iai_bets)*100:.1f}%" if iai_bets else "N/A",
+        static_win_rate,
+        iai_win_rate,
         "-",
     )
     
     # Max drawdown
-    def calc_max_dd(bets):
-        if not bets:
-            return 0
-        peak = 1000
-        max_dd = 0
-        for b in bets:
-            if b["bankroll"] > peak:
-                peak = b["bankroll"]
-            dd = (peak - b["bankroll"]) / peak * 100
-            if dd > max_dd:
-                max_dd = dd
-        return max_dd
-    
-    static_dd = calc_max_dd(static_bets)
-    iai_dd = calc_max_dd(iai_bets)
+    static_dd = static_stats.max_drawdown * 100
+    iai_dd = iai_stats.max_drawdown * 100
     dd_winner = "IAI 🏆" if iai_dd < static_dd else "Static 🏆" if static_dd < iai_dd else "Tie"
     
     table.add_row(
@@ -0,0 +1,159 @@
+"""Parallel Parameter Sweep - Static strategy over leagues x parameter grid
+
+Backtests every combination of selection, odds window and stake % on every
+enabled league (see league_config.py). Each backtest is independent, so the
+grid is spread over a multiprocessing Pool.
+
+Leagues are loaded once as NumPy arrays (FootballDataLoader.load_season_arrays)
+and indexed by odds per selection (build_odds_index). The indexes are handed
+to each worker process when it starts, so tasks only carry a league code and
+a set of invariants, and each backtest finds its bets with a binary search.
+The sweep ranks on order-independent results; the top rows are then re-run
+in match order for their drawdown.
+
+LOCAL RESEARCH ONLY - does not affect cloud/production code.
+
+Usage:
+    python parallel_sweep.py
+"""
+
+import os
+import sys
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+# Add the iai_betting directory to path for imports
+iai_betting_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(iai_betting_dir))
+
+from core.data import FootballDataLoader
+from league_config import get_enabled_leagues
+from iai_evolution import (
+    BettingInvariants,
+    build_odds_index,
+    load_league_arrays,
+    run_static_aggregate,
+    run_static_strategy,
+)
+
+
+SEASONS = ["1718", "1819", "1920", "2021", "2122", "2223", "2324"]
+
+# Parameter grid swept on every league
+SELECTIONS = ["H", "D", "A"]
+ODDS_WINDOWS = [(2.0, 3.0), (3.0, 4.0), (4.0, 6.0), (6.0, 10.0)]
+STAKE_PCTS = [1.0, 2.0, 3.0]
+
+STARTING_BANKROLL = 1000.0
+
+# Odds index per league in a worker process (set by _init_worker)
+_index_by_league: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]] = {}
+
+
+def build_grid() -> List[BettingInvariants]:
+    """Every combination of SELECTIONS, ODDS_WINDOWS and STAKE_PCTS."""
+    return [
+        BettingInvariants(selection=selection, min_odds=min_odds, max_odds=max_odds, stake_pct=stake_pct)
+        for selection, (min_odds, max_odds), stake_pct in product(SELECTIONS, ODDS_WINDOWS, STAKE_PCTS)
+    ]
+
+
+def _init_worker(index_by_league: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]]):
+    global _index_by_league
+    _index_by_league = index_by_league
+
+
+def _worker(task: Tuple[str, BettingInvariants]) -> Dict:
+    """Backtest one (league, invariants) task in a worker process."""
+    league, invariants = task
+    stats = run_static_aggregate(_index_by_league[league], invariants, STARTING_BANKROLL)
+    return {
+        "league": league,
+        "invariants": invariants,
+        "bets": stats.n_bets,
+        "wins": stats.wins,
+        "final_bankroll": stats.final_bankroll,
+    }
+
+
+def run_sweep(
+    index_by_league: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]],
+    grid: List[BettingInvariants],
+    processes: Optional[int] = None,
+) -> List[Dict]:
+    """Backtest every league against every set of invariants, in parallel.
+    
+    Takes each league's odds index (see build_odds_index). Results come back
+    in task order: league by league, grid order within each league.
+    """
+    tasks = [(league, invariants) for league in index_by_league for invariants in grid]
+    with Pool(
+        processes=processes or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(index_by_league,),
+    ) as pool:
+        return pool.map(_worker, tasks)
+
+
+def main():
+    console = Console()
+    
+    console.print()
+    console.print("[bold cyan]PARALLEL PARAMETER SWEEP[/bold cyan]\n")
+    
+    loader = FootballDataLoader()
+    arrays_by_league = {}
+    for config in get_enabled_leagues():
+        arrays = load_league_arrays(loader, config.code, SEASONS)
+        if arrays is not None and len(arrays["result"]):
+            arrays_by_league[config.code] = arrays
+    
+    grid = build_grid()
+    console.print(f"[green]✓ {len(arrays_by_league)} leagues × {len(grid)} parameter sets "
+                  f"on {os.cpu_count()} processes[/green]\n")
+    
+    index_by_league = {league: build_odds_index(arrays) for league, arrays in arrays_by_league.items()}
+    results = run_sweep(index_by_league, grid)
+    # Configs that never bet (flat +0.0%) rank below every one that did
+    results.sort(key=lambda r: (r["bets"] > 0, r["final_bankroll"]), reverse=True)
+    
+    table = Table(title="Top 15 by final bankroll", box=box.ROUNDED)
+    table.add_column("League", style="cyan")
+    table.add_column("Selection")
+    table.add_column("Odds", justify="right")
+    table.add_column("Stake", justify="right")
+    table.add_column("Bets", justify="right")
+    table.add_column("Win %", justify="right")
+    table.add_column("ROI", justify="right")
+    table.add_column("Max DD", justify="right")
+    
+    for r in results[:15]:
+        inv = r["invariants"]
+        # Drawdown depends on the order of the bets, so re-run in match order
+        stats, _ = run_static_strategy(arrays_by_league[r["league"]], inv, STARTING_BANKROLL)
+        win_pct = r["wins"] / r["bets"] * 100 if r["bets"] else 0
+        roi = (r["final_bankroll"] - STARTING_BANKROLL) / STARTING_BANKROLL * 100
+        color = "green" if roi > 0 else "red"
+        table.add_row(
+            r["league"],
+            inv.selection,
+            f"{inv.min_odds:.1f}-{inv.max_odds:.1f}",
+            f"{inv.stake_pct:.0f}%",
+            str(r["bets"]),
+            f"{win_pct:.1f}%",
+            f"[{color}]{roi:+.1f}%[/{color}]",
+            f"{stats.max_drawdown * 100:.1f}%",
+        )
+    
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
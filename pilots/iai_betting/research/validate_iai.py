@@ -16,6 +16,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from iai_core.orchestrator import IAIOrchestrator
 from iai_core.hypotheses import ALL_HYPOTHESES
 
+# Columns the evaluation and research scripts use; the Football-Data CSVs
+# carry 100+ bookmaker and match-stat columns that are never read
+REQUIRED_COLUMNS = ['Date', 'HomeTeam', 'AwayTeam', 'FTR', 'B365H', 'B365D', 'B365A']
+
 
 def load_historical_data():
     """Load all historical football data."""
@@ -47,7 +51,7 @@ def load_historical_data():
                 season = "unknown"
             
             try:
-                df = pd.read_csv(file)
+                df = pd.read_csv(file, usecols=lambda col: col in REQUIRED_COLUMNS)
                 df['League'] = league_code
                 df['LeagueName'] = league_name
                 df['Season'] = season
@@ -63,13 +67,12 @@ def load_historical_data():
     print(f"\nTotal matches loaded: {len(combined)}")
     
     # Ensure required columns exist
-    required_cols = ['Date', 'HomeTeam', 'AwayTeam', 'FTR', 'B365H', 'B365D', 'B365A']
-    missing = [col for col in required_cols if col not in combined.columns]
+    missing = [col for col in REQUIRED_COLUMNS if col not in combined.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
     
     # Clean data
-    combined = combined.dropna(subset=required_cols)
+    combined = combined.dropna(subset=REQUIRED_COLUMNS)
     print(f"After cleaning: {len(combined)} matches with complete data")
     
     return combined
@@ -0,0 +1,87 @@
+"""
+Tests for BettingEvaluator's financial metrics.
+
+Pins the vectorised bet simulation against a plain-Python replay of the
+same bets, one match at a time.
+
+Usage:
+    pytest pilots/iai_betting/tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the iai_betting directory to path for imports
+iai_betting_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(iai_betting_dir))
+
+from iai_core.evaluator import BettingEvaluator
+from iai_core.hypotheses import BettingHypothesis, ALL_HYPOTHESES
+
+
+def make_matches(n: int = 600, seed: int = 0) -> pd.DataFrame:
+    """Synthetic Football-Data style matches over three seasons."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Season": np.repeat(["2122", "2223", "2324"], n // 3),
+        "FTR": rng.choice(["H", "D", "A"], size=n, p=[0.45, 0.27, 0.28]),
+        "B365H": rng.uniform(1.2, 11.0, size=n).round(2),
+        "B365D": rng.uniform(2.5, 8.0, size=n).round(2),
+        "B365A": rng.uniform(1.3, 12.0, size=n).round(2),
+    })
+    df.loc[::37, "FTR"] = None  # Some matches without a result
+    return df
+
+
+def naive_replay(hypothesis: BettingHypothesis, df: pd.DataFrame,
+                 initial_bankroll: float = 1000) -> dict:
+    """Bet every qualifying match in order with a compounding stake."""
+    odds_col = {"H": "B365H", "D": "B365D", "A": "B365A"}[hypothesis.selection]
+    bankroll = initial_bankroll
+    total_staked = 0.0
+    total_return = 0.0
+    bets = 0
+    for _, row in df.iterrows():
+        odds = row[odds_col]
+        if pd.isna(row["FTR"]) or not (hypothesis.odds_min <= odds <= hypothesis.odds_max):
+            continue
+        stake = bankroll * hypothesis.stake_pct / 100
+        total_staked += stake
+        bets += 1
+        if row["FTR"] == hypothesis.selection:
+            total_return += stake * odds
+            bankroll += stake * (odds - 1)
+        else:
+            bankroll -= stake
+    return {
+        "total_bets": bets,
+        "total_staked": total_staked,
+        "total_return": total_return,
+        "profit": bankroll - initial_bankroll,
+    }
+
+
+@pytest.mark.parametrize("hypothesis", ALL_HYPOTHESES, ids=lambda h: h.id)
+def test_financial_metrics_match_naive_replay(hypothesis):
+    df = make_matches()
+    result = BettingEvaluator().evaluate(hypothesis, df)
+    expected = naive_replay(hypothesis, df)
+
+    if expected["total_bets"] < 20:
+        pytest.skip("too few qualifying bets to evaluate")
+
+    assert result.total_bets == expected["total_bets"]
+    assert result.total_staked == pytest.approx(expected["total_staked"], rel=1e-9)
+    assert result.total_return == pytest.approx(expected["total_return"], rel=1e-9)
+    assert result.profit == pytest.approx(expected["profit"], rel=1e-9)
+
+
+@pytest.mark.parametrize("hypothesis", ALL_HYPOTHESES, ids=lambda h: h.id)
+def test_total_return_is_stake_plus_profit(hypothesis):
+    result = BettingEvaluator().evaluate(hypothesis, make_matches())
+
+    assert result.total_return == pytest.approx(result.total_staked + result.profit, rel=1e-9)